@@ -28,8 +28,10 @@ export class ApiService {
   }
 
   previewFile(filePath: string): Observable<FilePreview> {
-    return this.http.get<FilePreview>(
-      `${this.baseUrl}/preview/${encodeURIComponent(filePath)}`
+    return this.http.post<FilePreview>(
+      `${this.baseUrl}/preview`,
+      { path: filePath },
+      this.httpOptions
     ).pipe(
       catchError(this.handleError)
     );
@@ -77,7 +77,7 @@ class JiraAgent(BaseAgent):
                 results.append({
                     'content': chunk.content,
                     'source': chunk.source,
-                    'metadata': chunk.metadata,
+                    'metadata': dict(chunk.metadata),
                     'relevance_score': chunk.relevance_score,
                     'chunk_id': chunk.chunk_id
                 })
@@ -67,7 +67,7 @@ class VideoAgent(BaseAgent):
                 result = {
                     'source': chunk.source,
                     'content': chunk.content,
-                    'metadata': chunk.metadata,
+                    'metadata': dict(chunk.metadata),
                     'relevance_type': 'content_match',
                     'chunk_id': chunk.chunk_id
                 }
@@ -82,7 +82,7 @@ class VideoAgent(BaseAgent):
                     result = {
                         'source': chunk.source,
                         'content': chunk.content,
-                        'metadata': chunk.metadata,
+                        'metadata': dict(chunk.metadata),
                         'relevance_type': 'content_match',
                         'chunk_id': chunk.chunk_id
                     }
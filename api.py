@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
@@ -15,11 +16,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Initialize orchestrator
+orchestrator = AgenticOrchestrator()
+
+@asynccontextmanager
+async def lifespan(app):
+    await orchestrator.warmup()
+    yield
+    await orchestrator.aclose()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Agentic AI Workflows",
     description="Multi-agent system for pulling information from various sources",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -31,9 +42,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize orchestrator
-orchestrator = AgenticOrchestrator()
-
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main web interface"""
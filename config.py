@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     # LLM Provider Configuration
     llm_provider: str = os.getenv("LLM_PROVIDER", "gemini")  # openai, aws, groq, gemini, ollama, huggingface, together, replicate, local_openai
     #llm_provider: str = os.getenv("LLM_PROVIDER", "openai")  # openai, aws, groq, ollama, huggingface, together, replicate, local_openai
+    llm_warmup: bool = os.getenv("LLM_WARMUP", "false").lower() == "true"  # Send a tiny request at startup to warm connections/models
     
     # OpenAI Configuration
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
@@ -28,6 +29,7 @@ class Settings(BaseSettings):
     # Ollama Configuration (Local Models)
     ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     ollama_model: str = os.getenv("OLLAMA_MODEL", "llama2")  # llama2, mistral, codellama, etc.
+    ollama_skip_healthcheck: bool = os.getenv("OLLAMA_SKIP_HEALTHCHECK", "false").lower() == "true"  # Skip the /api/tags probe on client construction
     
     # Hugging Face Configuration (Local Transformers)
     huggingface_model: str = os.getenv("HUGGINGFACE_MODEL", "microsoft/DialoGPT-medium")
@@ -95,6 +97,7 @@ class Settings(BaseSettings):
     # Application Configuration
     app_host: str = os.getenv("APP_HOST", "0.0.0.0")
     app_port: int = int(os.getenv("APP_PORT", "8000"))
+    app_workers: int = int(os.getenv("APP_WORKERS", "1"))  # 0 = one worker per CPU core
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     
     class Config:
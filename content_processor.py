@@ -5,14 +5,85 @@ Content processing utilities for extracting and chunking content from various so
 import os
 import re
 import hashlib
-from typing import List, Dict, Any
+import heapq
+import time
+from collections import ChainMap
+from types import MappingProxyType
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Tuple, Union
 from datetime import datetime
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Sentence terminators in priority order when choosing a chunk boundary
+_SENT_ENDINGS = ('.', '!', '?', '\n\n')
+_SENT_ENDINGS_BYTES = tuple(ending.encode() for ending in _SENT_ENDINGS)
+
+# Shared read-only parent for chunks created without metadata
+_EMPTY_METADATA = MappingProxyType({})
+
+def _find_sentence_boundary(text: Union[str, bytes], start: int, preferred_end: int) -> int:
+    """Find a good sentence boundary near the preferred end"""
+    # Look for sentence endings within a reasonable range
+    search_start = max(start, preferred_end - 100)
+    search_end = min(len(text), preferred_end + 100)
+    
+    # The first terminator kind present wins; the boundary falls just past its first character
+    endings = _SENT_ENDINGS_BYTES if isinstance(text, bytes) else _SENT_ENDINGS
+    for ending in endings:
+        pos = text.rfind(ending, search_start, search_end)
+        if pos > search_start:
+            return pos + 1
+    
+    return preferred_end
+
+@lru_cache(maxsize=4096)
+def _domain(url: str) -> str:
+    """Extract and memoize the network location of a URL"""
+    return urlsplit(url).netloc
+
+@lru_cache(maxsize=8)
+def _make_chunker(chunk_size: int, overlap_size: int) -> Callable[[str], List[Tuple[int, int]]]:
+    """Build a chunk-span function with the chunk geometry bound as constants"""
+    step = chunk_size - overlap_size
+    
+    def chunk_spans(text: str) -> List[Tuple[int, int]]:
+        spans = []
+        text_len = len(text)
+        start = 0
+        # ASCII text scans as bytes; offsets are identical to str offsets
+        haystack = text.encode('ascii') if text.isascii() else text
+        
+        while start < text_len:
+            end = start + chunk_size
+            
+            # Try to break at sentence boundaries
+            if end < text_len:
+                sentence_end = _find_sentence_boundary(haystack, start, end)
+                if sentence_end > start:
+                    end = sentence_end
+            
+            spans.append((start, end))
+            
+            # Move start position with overlap
+            start = max(start + step, end)
+        
+        return spans
+    
+    return chunk_spans
+
 class ContentChunk:
-    """Represents a chunk of content with metadata"""
+    """Represents a chunk of content with metadata
+    
+    Chunks from chunk_text() share a read-only view of the caller's metadata,
+    so metadata is a Mapping rather than a dict; use dict(chunk.metadata) or
+    to_dict() to get a plain copy. Pickling converts it automatically.
+    """
+    
+    # No per-instance __dict__; chunks are created in bulk during indexing
+    __slots__ = ('content', 'source', 'source_type', 'metadata', 'chunk_id', 'created_at_ns')
     
     def __init__(self, content: str, source: str, source_type: str, metadata: Dict[str, Any] = None):
         self.content = content
@@ -20,7 +91,22 @@ class ContentChunk:
         self.source_type = source_type
         self.metadata = metadata or {}
         self.chunk_id = self._generate_chunk_id()
-        self.created_at = datetime.now().isoformat()
+        self.created_at_ns = time.time_ns()
+    
+    @property
+    def created_at(self) -> str:
+        """Creation time as an ISO 8601 string"""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9).isoformat()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle metadata as a plain dict; ChainMap over MappingProxyType can't be pickled"""
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['metadata'] = dict(self.metadata)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            setattr(self, slot, value)
     
     def _generate_chunk_id(self) -> str:
         """Generate a unique ID for this chunk"""
@@ -35,7 +121,7 @@ class ContentChunk:
             'content': self.content,
             'source': self.source,
             'source_type': self.source_type,
-            'metadata': self.metadata,
+            'metadata': dict(self.metadata),
             'created_at': self.created_at,
             'content_length': len(self.content)
         }
@@ -46,6 +132,7 @@ class ContentProcessor:
     def __init__(self, chunk_size: int = 1000, overlap_size: int = 200):
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
+        self._chunker = _make_chunker(chunk_size, overlap_size)
     
     def chunk_text(self, text: str, source: str, source_type: str, metadata: Dict[str, Any] = None) -> List[ContentChunk]:
         """Split text into overlapping chunks"""
@@ -53,51 +140,25 @@ class ContentProcessor:
             return [ContentChunk(text, source, source_type, metadata)]
         
         chunks = []
-        start = 0
+        # Chunks overlay their position on one shared view of the base metadata
+        base_metadata = MappingProxyType(metadata) if metadata else _EMPTY_METADATA
         
-        while start < len(text):
-            end = start + self.chunk_size
-            
-            # Try to break at sentence boundaries
-            if end < len(text):
-                # Look for sentence endings
-                sentence_end = self._find_sentence_boundary(text, start, end)
-                if sentence_end > start:
-                    end = sentence_end
-            
+        for start, end in self._chunker(text):
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunk_metadata = metadata.copy() if metadata else {}
-                chunk_metadata.update({
+                chunk_metadata = ChainMap({
                     'chunk_start': start,
                     'chunk_end': end,
                     'chunk_index': len(chunks)
-                })
+                }, base_metadata)
                 
                 chunks.append(ContentChunk(chunk_text, source, source_type, chunk_metadata))
-            
-            # Move start position with overlap
-            start = max(start + self.chunk_size - self.overlap_size, end)
         
         return chunks
     
     def _find_sentence_boundary(self, text: str, start: int, preferred_end: int) -> int:
         """Find a good sentence boundary near the preferred end"""
-        # Look for sentence endings within a reasonable range
-        search_start = max(start, preferred_end - 100)
-        search_end = min(len(text), preferred_end + 100)
-        
-        # Look for sentence endings
-        sentence_endings = ['.', '!', '?', '\n\n']
-        best_pos = preferred_end
-        
-        for ending in sentence_endings:
-            pos = text.rfind(ending, search_start, search_end)
-            if pos > search_start:
-                best_pos = pos + 1
-                break
-        
-        return best_pos
+        return _find_sentence_boundary(text, start, preferred_end)
     
     def process_file_content(self, file_path: str, content: str) -> List[ContentChunk]:
         """Process content from a file"""
@@ -127,13 +188,19 @@ class ContentProcessor:
             'response_metadata': response_metadata or {}
         }
         
-        # If content is JSON, convert to readable text
-        if isinstance(content, dict):
-            content = self._dict_to_text(content)
-        elif isinstance(content, list):
-            content = '\n'.join([self._dict_to_text(item) if isinstance(item, dict) else str(item) for item in content])
+        return self.chunk_text(content, endpoint, 'api', metadata)
+    
+    def process_api_json(self, endpoint: str, data: Union[dict, list], response_metadata: Dict[str, Any] = None) -> List[ContentChunk]:
+        """Process a decoded JSON API response"""
+        # Convert JSON to readable text once, then chunk it like any other response
+        if isinstance(data, dict):
+            content = self._dict_to_text(data)
+        elif isinstance(data, list):
+            content = '\n'.join(self._dict_to_text(item) if isinstance(item, dict) else str(item) for item in data)
+        else:
+            content = str(data)
         
-        return self.chunk_text(str(content), endpoint, 'api', metadata)
+        return self.process_api_content(endpoint, content, response_metadata)
     
     def process_video_content(self, video_source: str, transcript: str, video_metadata: Dict[str, Any] = None) -> List[ContentChunk]:
         """Process content from video transcripts"""
@@ -173,18 +240,11 @@ class ContentProcessor:
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        from urllib.parse import urlparse
-        return urlparse(url).netloc
+        return _domain(url)
     
     def _dict_to_text(self, data: dict) -> str:
         """Convert dictionary to readable text"""
-        lines = []
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                lines.append(f"{key}: {str(value)}")
-            else:
-                lines.append(f"{key}: {value}")
-        return '\n'.join(lines)
+        return '\n'.join(f"{key}: {value}" for key, value in data.items())
 
 class ContentIndex:
     """Simple in-memory content index for question answering"""
@@ -228,9 +288,8 @@ class ContentIndex:
             if score > 0:
                 scored_chunks.append((chunk, score))
         
-        # Sort by score and return top results
-        scored_chunks.sort(key=lambda x: x[1], reverse=True)
-        return [chunk for chunk, score in scored_chunks[:max_results]]
+        # Select the top results without sorting every candidate
+        return [chunk for chunk, score in heapq.nlargest(max_results, scored_chunks, key=lambda x: x[1])]
     
     def _calculate_relevance_score(self, content: str, query_words: set) -> float:
         """Calculate relevance score for content"""
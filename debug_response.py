@@ -3,14 +3,19 @@
 Debug script to check what the backend actually returns
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def test_backend_response():
     """Test what the backend actually returns"""
     print("🔍 Testing backend response structure...")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8001/search",
             json={"prompt": "who is prime minister of india", "max_results": 3},
             headers={"Content-Type": "application/json"},
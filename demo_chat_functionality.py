@@ -2,35 +2,45 @@
 """
 Demo script showing the complete Agentic AI Workflows functionality
 """
-import requests
+import asyncio
+import aiohttp
 import json
 import time
 
-def demo_search_query(query):
+# Maximum number of demo queries in flight against the backend at once
+CONCURRENCY = 4
+
+async def demo_search_query(session, query, semaphore):
     """Demonstrate a search query through the backend API"""
-    print(f"\n🔍 Demo Query: '{query}'")
-    print("-" * 50)
-    
     try:
         payload = {
             "prompt": query,
             "max_results": 3
         }
         
-        print("📤 Sending request to backend...")
-        start_time = time.time()
-        
-        response = requests.post(
-            "http://localhost:8001/search",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        async with semaphore:
+            start_time = time.time()
+            
+            async with session.post(
+                "http://localhost:8001/search",
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                status = response.status
+                if status == 200:
+                    data = await response.json()
+                else:
+                    text = await response.text()
+            
+            end_time = time.time()
         
-        end_time = time.time()
         response_time = round((end_time - start_time) * 1000, 2)
         
-        if response.status_code == 200:
-            data = response.json()
+        # Print once the response is in so concurrent queries don't interleave
+        print(f"\n🔍 Demo Query: '{query}'")
+        print("-" * 50)
+        
+        if status == 200:
             print(f"✅ Response received in {response_time}ms")
             print(f"🤖 Agents used: {', '.join(data.get('agents_used', []))}")
             print(f"📊 Results found: {len(data.get('results', []))}")
@@ -52,13 +62,14 @@ def demo_search_query(query):
                 print(f"   {summary_preview}")
                 
         else:
-            print(f"❌ Request failed with status {response.status_code}")
-            print(f"   Response: {response.text}")
+            print(f"❌ Request failed with status {status}")
+            print(f"   Response: {text}")
             
     except Exception as e:
+        print(f"\n🔍 Demo Query: '{query}'")
         print(f"❌ Error: {e}")
 
-def main():
+async def main():
     """Run demo queries"""
     print("🎯 AGENTIC AI WORKFLOWS - CHAT FUNCTIONALITY DEMO")
     print("=" * 60)
@@ -73,9 +84,10 @@ def main():
         "Find any documentation or README files"
     ]
     
-    for query in demo_queries:
-        demo_search_query(query)
-        time.sleep(1)  # Brief pause between queries
+    print("📤 Sending requests to backend...")
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*[demo_search_query(session, query, semaphore) for query in demo_queries])
     
     print("\n" + "=" * 60)
     print("🎉 DEMO COMPLETE!")
@@ -90,4 +102,4 @@ def main():
     print("🔧 Backend API docs at: http://localhost:8001/docs")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
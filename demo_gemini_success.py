@@ -4,9 +4,14 @@ Final demonstration of Google Gemini integration success
 """
 import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 from config import settings
 from llm_client import get_llm_client
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 async def demo_gemini_capabilities():
     """Demonstrate Gemini's capabilities"""
     print("🤖 GOOGLE GEMINI CAPABILITIES DEMO")
@@ -65,7 +70,7 @@ def demo_backend_integration():
     print(f"🔍 Testing: '{test_query}'")
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8001/search",
             json={"prompt": test_query, "max_results": 3},
             headers={"Content-Type": "application/json"},
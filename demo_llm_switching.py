@@ -33,34 +33,28 @@ async def demo_provider_switching():
     print(f"Query: '{test_messages[1]['content']}'")
     print("-" * 50)
     
+    async def test_provider(provider_id):
+        # Each provider gets its own client, so no shared settings are mutated
+        client = get_llm_client(provider_id)
+        return await client.chat_completion(test_messages, max_tokens=50)
+    
+    # Query every provider concurrently; total time is bounded by the slowest one
+    responses = await asyncio.gather(
+        *[test_provider(provider_id) for provider_id, _ in demo_providers],
+        return_exceptions=True
+    )
+    
     successful_tests = 0
     
-    for provider_id, provider_name in demo_providers:
+    for (provider_id, provider_name), response in zip(demo_providers, responses):
         print(f"\n🔹 Testing {provider_name}...")
         
-        # Store original provider
-        original_provider = settings.llm_provider
-        
-        try:
-            # Switch to new provider
-            settings.llm_provider = provider_id
-            
-            # Get fresh client instance
-            client = get_llm_client()
-            
-            # Test the provider
-            response = await client.chat_completion(test_messages, max_tokens=50)
-            
+        if isinstance(response, Exception):
+            print(f"   ⚠️  Not available: {str(response)}")
+        else:
             print(f"   ✅ Success!")
             print(f"   📝 Response: {response.strip()}")
             successful_tests += 1
-            
-        except Exception as e:
-            print(f"   ⚠️  Not available: {str(e)}")
-            
-        finally:
-            # Restore original provider
-            settings.llm_provider = original_provider
     
     print("\n" + "=" * 50)
     print("📊 DEMO RESULTS")
@@ -3,9 +3,18 @@
 Diagnostic script to identify GROQ integration issues
 """
 import asyncio
+import mmap
 import os
+import httpx
 from config import settings
 
+def make_http_client():
+    """Create the async HTTP client, using HTTP/2 when the h2 package is installed"""
+    try:
+        return httpx.AsyncClient(http2=True, timeout=30)
+    except ImportError:
+        return httpx.AsyncClient(timeout=30)
+
 def check_environment():
     """Check environment configuration"""
     print("🔍 ENVIRONMENT DIAGNOSTICS")
@@ -19,123 +28,114 @@ def check_environment():
     env_file = ".env"
     if os.path.exists(env_file):
         print(f"📄 .env file: ✅ Found")
-        with open(env_file, 'r') as f:
-            content = f.read()
-            if "LLM_PROVIDER=groq" in content:
-                print("✅ LLM_PROVIDER=groq found in .env")
-            else:
-                print("⚠️  LLM_PROVIDER=groq not found in .env")
+        # Scan the mapped file as bytes instead of decoding it into a string
+        found = False
+        if os.path.getsize(env_file) > 0:
+            with open(env_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                found = mm.find(b"LLM_PROVIDER=groq") != -1
+        
+        if found:
+            print("✅ LLM_PROVIDER=groq found in .env")
+        else:
+            print("⚠️  LLM_PROVIDER=groq not found in .env")
     else:
         print(f"📄 .env file: ❌ Not found")
     
     return settings.llm_provider == "groq" and settings.groq_api_key
 
 async def test_llm_client_direct():
-    """Test LLM client directly"""
-    print("\n🧪 TESTING LLM CLIENT DIRECTLY")
-    print("=" * 40)
+    """Test LLM client directly; returns (ok, output lines)"""
+    lines = ["\n🧪 TESTING LLM CLIENT DIRECTLY", "=" * 40]
     
     try:
         from llm_client import get_llm_client
         
-        # Force GROQ provider
-        original_provider = settings.llm_provider
-        settings.llm_provider = "groq"
-        
-        print("🚀 Initializing LLM client...")
-        client = get_llm_client()
-        print("✅ LLM client initialized")
+        lines.append("🚀 Initializing LLM client...")
+        # Ask for the GROQ client directly instead of switching the global provider
+        client = get_llm_client("groq")
+        lines.append("✅ LLM client initialized")
         
-        print("💬 Testing chat completion...")
+        lines.append("💬 Testing chat completion...")
         messages = [
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "Say 'Hello, GROQ is working!' in exactly those words."}
         ]
         
         response = await client.chat_completion(messages, max_tokens=50)
-        print(f"✅ Chat completion successful!")
-        print(f"📝 Response: {response}")
-        
-        # Restore original provider
-        settings.llm_provider = original_provider
-        return True
+        lines.append(f"✅ Chat completion successful!")
+        lines.append(f"📝 Response: {response}")
+        return True, lines
         
     except Exception as e:
-        print(f"❌ LLM client test failed: {str(e)}")
-        settings.llm_provider = original_provider
-        return False
+        lines.append(f"❌ LLM client test failed: {str(e)}")
+        return False, lines
 
 async def test_orchestrator():
-    """Test the orchestrator's LLM integration"""
-    print("\n🎯 TESTING ORCHESTRATOR LLM INTEGRATION")
-    print("=" * 40)
+    """Test the orchestrator's LLM integration; returns (ok, output lines)"""
+    lines = ["\n🎯 TESTING ORCHESTRATOR LLM INTEGRATION", "=" * 40]
     
     try:
         # Import the working orchestrator
         from main_working import WorkingOrchestrator
         from models import QueryRequest
         
-        print("🚀 Initializing orchestrator...")
+        lines.append("🚀 Initializing orchestrator...")
         orchestrator = WorkingOrchestrator()
         
         if orchestrator.llm_client:
-            print("✅ Orchestrator has LLM client")
+            lines.append("✅ Orchestrator has LLM client")
         else:
-            print("❌ Orchestrator missing LLM client")
-            return False
+            lines.append("❌ Orchestrator missing LLM client")
+            return False, lines
         
-        print("💬 Testing query processing...")
+        lines.append("💬 Testing query processing...")
         request = QueryRequest(prompt="Hello, can you help me find files?", max_results=5)
         result = await orchestrator.process_query(request)
         
-        print(f"✅ Query processed successfully!")
-        print(f"📊 Results: {len(result.results)} agent results")
+        lines.append(f"✅ Query processed successfully!")
+        lines.append(f"📊 Results: {len(result.results)} agent results")
         
         if result.answer:
-            print(f"🤖 LLM Answer: {result.answer[:100]}...")
-            return True
+            lines.append(f"🤖 LLM Answer: {result.answer[:100]}...")
+            return True, lines
         else:
-            print("⚠️  No LLM answer generated")
-            return False
+            lines.append("⚠️  No LLM answer generated")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ Orchestrator test failed: {str(e)}")
-        return False
+        lines.append(f"❌ Orchestrator test failed: {str(e)}")
+        return False, lines
 
-async def test_backend_integration():
-    """Test full backend integration"""
-    print("\n🌐 TESTING BACKEND INTEGRATION")
-    print("=" * 40)
+async def test_backend_integration(client: httpx.AsyncClient):
+    """Test full backend integration; returns (ok, output lines)"""
+    lines = ["\n🌐 TESTING BACKEND INTEGRATION", "=" * 40]
     
     try:
-        import requests
-        
-        print("🔍 Testing search endpoint...")
-        response = requests.post(
+        lines.append("🔍 Testing search endpoint...")
+        response = await client.post(
             "http://localhost:8001/search",
             json={"prompt": "Find Python files in this project"},
-            headers={"Content-Type": "application/json"},
-            timeout=30
+            headers={"Content-Type": "application/json"}
         )
         
         if response.status_code == 200:
             data = response.json()
-            print("✅ Backend request successful!")
+            lines.append("✅ Backend request successful!")
             
             if "answer" in data and data["answer"]:
-                print(f"🤖 Backend LLM Answer: {data['answer'][:100]}...")
-                return True
+                lines.append(f"🤖 Backend LLM Answer: {data['answer'][:100]}...")
+                return True, lines
             else:
-                print("⚠️  Backend returned no LLM answer")
-                print(f"📊 Response keys: {list(data.keys())}")
-                return False
+                lines.append("⚠️  Backend returned no LLM answer")
+                lines.append(f"📊 Response keys: {list(data.keys())}")
+                return False, lines
         else:
-            print(f"❌ Backend request failed: {response.status_code}")
-            return False
+            lines.append(f"❌ Backend request failed: {response.status_code}")
+            return False, lines
             
     except Exception as e:
-        print(f"❌ Backend test failed: {str(e)}")
-        return False
+        lines.append(f"❌ Backend test failed: {str(e)}")
+        return False, lines
 
 async def main():
     """Main diagnostic function"""
@@ -154,14 +154,26 @@ async def main():
         print("4. Add: GROQ_MODEL=llama3-8b-8192")
         return
     
-    # Step 2: Test LLM client
-    client_ok = await test_llm_client_direct()
-    
-    # Step 3: Test orchestrator
-    orchestrator_ok = await test_orchestrator()
+    # Steps 2-4: LLM client, orchestrator and backend are independent, run them together.
+    # Each stage returns its output lines, printed in stage order so they don't interleave
+    async with make_http_client() as client:
+        results = await asyncio.gather(
+            test_llm_client_direct(),
+            test_orchestrator(),
+            test_backend_integration(client),
+            return_exceptions=True
+        )
     
-    # Step 4: Test backend
-    backend_ok = await test_backend_integration()
+    stage_ok = []
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"\n❌ Diagnostic stage crashed: {result!r}")
+            stage_ok.append(False)
+        else:
+            ok, lines = result
+            print("\n".join(lines))
+            stage_ok.append(ok)
+    client_ok, orchestrator_ok, backend_ok = stage_ok
     
     print("\n" + "=" * 50)
     print("📊 DIAGNOSTIC RESULTS")
@@ -1,43 +1,166 @@
 """
 LLM Client Factory for multiple providers (OpenAI, AWS Bedrock, GROQ)
 """
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+class _RootHandlerRelay(logging.Handler):
+    """Pass records drained from the log queue to the root logger's handlers"""
+    
+    def emit(self, record: logging.LogRecord):
+        for handler in logging.getLogger().handlers or [logging.lastResort]:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+# Request-path logging only enqueues records; a listener thread does the I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _RootHandlerRelay())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+# Compact JSON encoder reused for request bodies
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Provider SDKs are imported on first use only; heavy stacks like
+# transformers/torch must never load unless that provider is selected.
+@functools.lru_cache(maxsize=None)
+def _import_module(name: str):
+    """Import a provider SDK once and memoize the module object"""
+    import importlib
+    return importlib.import_module(name)
+
+# Process-wide HTTP/2 transport shared by the hosted API SDKs
+_http2_client = None
+
+def _get_http2_client():
+    """Return the shared httpx client, creating it on first use"""
+    global _http2_client
+    if _http2_client is None:
+        httpx = _import_module('httpx')
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        try:
+            _http2_client = httpx.AsyncClient(http2=True, limits=limits, timeout=60)
+        except ImportError:
+            # HTTP/2 needs the optional h2 package; keep the pooled HTTP/1.1 client
+            logger.warning("h2 package not installed, using HTTP/1.1. Run: pip install httpx[http2]")
+            _http2_client = httpx.AsyncClient(limits=limits, timeout=60)
+    return _http2_client
+
+async def _close_http2_client():
+    """Close the shared httpx client; the next _get_http2_client() call builds a fresh one"""
+    global _http2_client
+    client, _http2_client = _http2_client, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+def _fail_requests(requests, error: Exception):
+    """Fail the futures of queued (messages, kwargs, future) requests that are still pending"""
+    for _, _, future in requests:
+        if not future.done():
+            try:
+                future.set_exception(error)
+            except RuntimeError:
+                pass  # The future's event loop is already closed
+
 class LLMClient:
     """Unified LLM client interface for multiple providers"""
     
-    def __init__(self):
-        self.provider = settings.llm_provider.lower()
+    # Concurrent requests arriving within BATCH_WAIT_MS are dispatched together
+    BATCH_MAX = 8
+    BATCH_WAIT_MS = 10
+    
+    # Number of prompt/response pairs kept in the LRU response cache
+    CACHE_MAXSIZE = 1024
+    
+    # Role prefixes for providers that take a flat prompt; other roles are dropped
+    _CLAUDE_ROLE_PREFIX = {"system": "System: ", "user": "Human: ", "assistant": "Assistant: "}
+    _SIMPLE_ROLE_PREFIX = {"system": "System: ", "user": "User: ", "assistant": "Assistant: "}
+    _GEMINI_ROLE_PREFIX = {"system": "Instructions: ", "user": "User: ", "assistant": "Assistant: "}
+    
+    # Sampling defaults per provider, keyed by the provider's own option names
+    _SAMPLING_DEFAULTS = {
+        "openai": {"temperature": 0.7, "max_tokens": 1000},
+        "aws": {"temperature": 0.7, "max_tokens_to_sample": 1000, "top_p": 0.9},
+        "groq": {"temperature": 0.7, "max_tokens": 1000},
+        "ollama": {"temperature": 0.7, "num_predict": 1000},
+        "huggingface": {"temperature": 0.7, "max_new_tokens": 200},
+        "together": {"temperature": 0.7, "max_tokens": 1000},
+        "replicate": {"temperature": 0.7, "max_new_tokens": 1000},
+        "local_openai": {"temperature": 0.7, "max_tokens": 1000},
+        "gemini": {"temperature": 0.7, "max_output_tokens": 1000, "top_p": 0.8, "top_k": 10},
+    }
+    
+    # Provider option that the generic max_tokens argument maps onto
+    _MAX_TOKENS_KEY = {
+        "aws": "max_tokens_to_sample",
+        "ollama": "num_predict",
+        "huggingface": "max_new_tokens",
+        "replicate": "max_new_tokens",
+        "gemini": "max_output_tokens",
+    }
+    
+    def __init__(self, provider: Optional[str] = None, verify: Optional[bool] = None, warmup: Optional[bool] = None):
+        self.provider = (provider or settings.llm_provider).lower()
+        self.verify = not settings.ollama_skip_healthcheck if verify is None else verify
         self.client = None
+        self._batch_queue = None
+        self._batch_worker = None
+        self._batch_tasks = set()
+        self._ollama_session = None
+        self._http_client = None  # Shared httpx pool, for the providers that use it
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._sampling_defaults = self._SAMPLING_DEFAULTS.get(self.provider, {})
+        self._max_tokens_key = self._MAX_TOKENS_KEY.get(self.provider, "max_tokens")
+        
+        # Provider name -> bound method, resolved once instead of per call
+        self._init_dispatch = {
+            "openai": self._initialize_openai,
+            "aws": self._initialize_aws_bedrock,
+            "groq": self._initialize_groq,
+            "ollama": self._initialize_ollama,
+            "huggingface": self._initialize_huggingface,
+            "together": self._initialize_together,
+            "replicate": self._initialize_replicate,
+            "local_openai": self._initialize_local_openai,
+            "gemini": self._initialize_gemini,
+        }
+        self._chat_dispatch = {
+            "openai": self._openai_chat_completion,
+            "aws": self._aws_chat_completion,
+            "groq": self._groq_chat_completion,
+            "ollama": self._ollama_chat_completion,
+            "huggingface": self._huggingface_chat_completion,
+            "together": self._together_chat_completion,
+            "replicate": self._replicate_chat_completion,
+            "local_openai": self._local_openai_chat_completion,
+            "gemini": self._gemini_chat_completion,
+        }
         self._initialize_client()
+        
+        # Opt-in: entry points call warmup() at startup to pay TLS / model load cost early
+        self.warmup_on_start = settings.llm_warmup if warmup is None else warmup
     
     def _initialize_client(self):
         """Initialize the appropriate LLM client based on provider"""
         try:
-            if self.provider == "openai":
-                self._initialize_openai()
-            elif self.provider == "aws":
-                self._initialize_aws_bedrock()
-            elif self.provider == "groq":
-                self._initialize_groq()
-            elif self.provider == "ollama":
-                self._initialize_ollama()
-            elif self.provider == "huggingface":
-                self._initialize_huggingface()
-            elif self.provider == "together":
-                self._initialize_together()
-            elif self.provider == "replicate":
-                self._initialize_replicate()
-            elif self.provider == "local_openai":
-                self._initialize_local_openai()
-            elif self.provider == "gemini":
-                self._initialize_gemini()
-            else:
+            initialize = self._init_dispatch.get(self.provider)
+            if initialize is None:
                 raise ValueError(f"Unsupported LLM provider: {self.provider}")
+            initialize()
                 
             logger.info(f"LLM client initialized successfully for provider: {self.provider}")
             
@@ -48,11 +171,12 @@ class LLMClient:
     def _initialize_openai(self):
         """Initialize OpenAI client"""
         try:
-            import openai
+            openai = _import_module('openai')
             if not settings.openai_api_key:
                 raise ValueError("OpenAI API key not configured")
             
-            self.client = openai.OpenAI(api_key=settings.openai_api_key)
+            self._http_client = _get_http2_client()
+            self.client = openai.AsyncOpenAI(api_key=settings.openai_api_key, http_client=self._http_client)
             self.model = settings.openai_model
             
         except ImportError:
@@ -61,7 +185,7 @@ class LLMClient:
     def _initialize_aws_bedrock(self):
         """Initialize AWS Bedrock client"""
         try:
-            import boto3
+            boto3 = _import_module('boto3')
             
             # Use existing AWS credentials from environment or IAM role
             self.client = boto3.client(
@@ -78,11 +202,12 @@ class LLMClient:
     def _initialize_groq(self):
         """Initialize GROQ client"""
         try:
-            import groq
+            groq = _import_module('groq')
             if not settings.groq_api_key:
                 raise ValueError("GROQ API key not configured")
             
-            self.client = groq.Groq(api_key=settings.groq_api_key)
+            self._http_client = _get_http2_client()
+            self.client = groq.AsyncGroq(api_key=settings.groq_api_key, http_client=self._http_client)
             self.model = settings.groq_model
             
         except ImportError:
@@ -91,16 +216,17 @@ class LLMClient:
     def _initialize_ollama(self):
         """Initialize Ollama client for local models"""
         try:
-            import requests
+            requests = _import_module('requests')
             
-            # Test connection to Ollama server
-            test_url = f"{settings.ollama_base_url}/api/tags"
-            response = requests.get(test_url, timeout=5)
-            
-            if response.status_code != 200:
-                raise ConnectionError(f"Cannot connect to Ollama server at {settings.ollama_base_url}")
+            # Test connection to Ollama server; requests themselves go through the aiohttp pool
+            if self.verify:
+                test_url = f"{settings.ollama_base_url}/api/tags"
+                response = requests.get(test_url, timeout=5)
+                
+                if response.status_code != 200:
+                    raise ConnectionError(f"Cannot connect to Ollama server at {settings.ollama_base_url}")
             
-            self.client = "ollama"  # We'll use requests directly
+            self.client = "ollama"  # We'll use aiohttp directly
             self.model = settings.ollama_model
             self.base_url = settings.ollama_base_url
             
@@ -112,24 +238,39 @@ class LLMClient:
     def _initialize_huggingface(self):
         """Initialize Hugging Face Transformers for local inference"""
         try:
-            from transformers import pipeline
-            import torch
+            transformers = _import_module('transformers')
+            torch = _import_module('torch')
             
             # Determine device
             if settings.huggingface_device == "auto":
-                device = 0 if torch.cuda.is_available() else -1
-            elif settings.huggingface_device == "cuda":
-                device = 0
+                use_cuda = torch.cuda.is_available()
             else:
-                device = -1
+                use_cuda = settings.huggingface_device == "cuda"
             
-            # Initialize the pipeline
-            self.client = pipeline(
-                "text-generation",
-                model=settings.huggingface_model,
-                device=device,
+            # bf16 weights and a compiled forward pass on GPU; CPU keeps fp32 eager mode
+            model = transformers.AutoModelForCausalLM.from_pretrained(
+                settings.huggingface_model,
+                torch_dtype=torch.bfloat16 if use_cuda else torch.float32,
+                device_map="auto" if use_cuda else None,
+                cache_dir=settings.huggingface_cache_dir
+            )
+            if use_cuda:
+                # Compile forward itself: generate() on a torch.compile wrapper runs the eager module
+                model.forward = torch.compile(model.forward, mode="reduce-overhead")
+            tokenizer = transformers.AutoTokenizer.from_pretrained(
+                settings.huggingface_model,
                 cache_dir=settings.huggingface_cache_dir
             )
+            
+            # Left padding keeps every prompt's last token aligned for batched generate
+            tokenizer.padding_side = "left"
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            
+            # _huggingface_generate calls the model's generate() directly
+            self.hf_model = model
+            self.tokenizer = tokenizer
+            self.client = model
             self.model = settings.huggingface_model
             
         except ImportError:
@@ -138,7 +279,7 @@ class LLMClient:
     def _initialize_together(self):
         """Initialize Together AI client"""
         try:
-            import together
+            together = _import_module('together')
             
             if not settings.together_api_key:
                 raise ValueError("Together AI API key not configured")
@@ -153,7 +294,7 @@ class LLMClient:
     def _initialize_replicate(self):
         """Initialize Replicate client"""
         try:
-            import replicate
+            replicate = _import_module('replicate')
             
             if not settings.replicate_api_token:
                 raise ValueError("Replicate API token not configured")
@@ -167,9 +308,9 @@ class LLMClient:
     def _initialize_local_openai(self):
         """Initialize local OpenAI-compatible server (LM Studio, text-generation-webui, etc.)"""
         try:
-            import openai
+            openai = _import_module('openai')
             
-            self.client = openai.OpenAI(
+            self.client = openai.AsyncOpenAI(
                 base_url=settings.local_openai_base_url,
                 api_key=settings.local_openai_api_key
             )
@@ -181,7 +322,7 @@ class LLMClient:
     def _initialize_gemini(self):
         """Initialize Google Gemini client"""
         try:
-            import google.generativeai as genai
+            genai = _import_module('google.generativeai')
             if not settings.gemini_api_key:
                 raise ValueError("Gemini API key not configured")
             
@@ -192,29 +333,197 @@ class LLMClient:
         except ImportError:
             raise ImportError("Google Generative AI package not installed. Run: pip install google-generativeai")
     
+    async def _run_blocking(self, fn, *args, **kwargs):
+        """Run a blocking SDK call in the default executor so the event loop stays free"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+    
+    async def _get_ollama_session(self):
+        """Get or create the aiohttp session used for Ollama requests"""
+        aiohttp = _import_module('aiohttp')
+        
+        if self._ollama_session is None or self._ollama_session.closed:
+            # Keep-alive pool reused across calls instead of a new connection per request
+            self._ollama_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._ollama_session
+    
+    async def aclose(self):
+        """Stop the batch worker and close the Ollama session and shared httpx pool"""
+        self._stop_batch_worker()
+        if self._ollama_session is not None and not self._ollama_session.closed:
+            await self._ollama_session.close()
+        self._ollama_session = None
+        
+        if self._http_client is not None and not self._http_client.is_closed:
+            # Pooled connections belong to this event loop; a later asyncio.run() needs new ones
+            await _close_http2_client()
+            for client in {self, *_clients.values()}:
+                if client._http_client is not None and client._http_client.is_closed:
+                    client._initialize_client()
+    
+    async def warmup(self):
+        """Issue a minimal request so connections and model weights are ready"""
+        try:
+            # Straight to the provider: the ping must not occupy the response cache
+            await self._dispatch_chat_completion([{"role": "user", "content": "ping"}], max_tokens=1)
+            logger.info(f"LLM warmup completed for provider: {self.provider}")
+        except Exception as e:
+            logger.warning(f"LLM warmup failed for {self.provider}: {str(e)}")
+    
     async def chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Generate chat completion using the configured provider"""
+        key = self._cache_key(messages, kwargs)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        
+        self._ensure_batch_worker()
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((messages, kwargs, future))
+        response = await future
+        
+        self._cache[key] = response
+        if len(self._cache) > self.CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+        return response
+    
+    def _cache_key(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> bytes:
+        """Hash the provider, model, messages and options into a cache key"""
+        payload = json.dumps(
+            [self.provider, getattr(self, 'model', None), messages, sorted(kwargs.items())],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+    
+    async def chat_completion_stream(self, messages: List[Dict[str, str]], **kwargs) -> AsyncIterator[str]:
+        """Stream a chat completion as text chunks arrive from the provider"""
         try:
-            if self.provider == "openai":
-                return await self._openai_chat_completion(messages, **kwargs)
-            elif self.provider == "aws":
-                return await self._aws_chat_completion(messages, **kwargs)
-            elif self.provider == "groq":
-                return await self._groq_chat_completion(messages, **kwargs)
+            if self.provider in ("openai", "groq", "local_openai"):
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                    **self._sampling(kwargs)
+                )
+                async for chunk in stream:
+                    if chunk.choices:
+                        yield chunk.choices[0].delta.content or ""
+            
             elif self.provider == "ollama":
-                return await self._ollama_chat_completion(messages, **kwargs)
-            elif self.provider == "huggingface":
-                return await self._huggingface_chat_completion(messages, **kwargs)
-            elif self.provider == "together":
-                return await self._together_chat_completion(messages, **kwargs)
-            elif self.provider == "replicate":
-                return await self._replicate_chat_completion(messages, **kwargs)
-            elif self.provider == "local_openai":
-                return await self._local_openai_chat_completion(messages, **kwargs)
+                payload = self._ollama_payload(messages, stream=True, **kwargs)
+                
+                session = await self._get_ollama_session()
+                async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+                    if response.status != 200:
+                        raise Exception(f"Ollama API error: {await response.text()}")
+                    
+                    # Ollama streams one JSON object per line
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        data = json.loads(line)
+                        yield data.get('response', '')
+                        if data.get('done'):
+                            break
+            
             elif self.provider == "gemini":
-                return await self._gemini_chat_completion(messages, **kwargs)
+                response = await self.client.generate_content_async(
+                    self._convert_messages_to_gemini_prompt(messages),
+                    generation_config=self._sampling(kwargs),
+                    stream=True
+                )
+                async for chunk in response:
+                    yield chunk.text
+            
+            else:
+                # Providers without a streaming API yield the full response once
+                yield await self.chat_completion(messages, **kwargs)
+                
+        except Exception as e:
+            logger.error(f"Streaming chat completion failed for {self.provider}: {str(e)}")
+            raise
+    
+    def _ensure_batch_worker(self):
+        """Start the batching worker on the running event loop if needed"""
+        if self._batch_worker is None or self._batch_worker.done() or self._batch_worker.get_loop() is not asyncio.get_running_loop():
+            self._stop_batch_worker()
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._run_batch_worker(self._batch_queue))
+    
+    def _stop_batch_worker(self):
+        """Cancel the batch worker and fail any requests still waiting in its queue"""
+        if self._batch_worker is not None and not self._batch_worker.done():
+            try:
+                self._batch_worker.cancel()
+            except RuntimeError:
+                pass  # Its event loop is already closed
+        self._batch_worker = None
+        
+        if self._batch_queue is not None:
+            pending = []
+            while not self._batch_queue.empty():
+                pending.append(self._batch_queue.get_nowait())
+            _fail_requests(pending, RuntimeError("LLM batch worker stopped"))
+            self._batch_queue = None
+    
+    async def _run_batch_worker(self, queue: asyncio.Queue):
+        """Collect queued requests into micro-batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.BATCH_WAIT_MS / 1000
+            
+            try:
+                while len(batch) < self.BATCH_MAX:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopped mid-collection: these requests would otherwise wait forever
+                _fail_requests(batch, RuntimeError("LLM batch worker stopped"))
+                raise
+            
+            # Run the batch in the background so the next one can start collecting
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _dispatch_batch(self, batch):
+        """Issue the provider calls for a batch and resolve each request's future"""
+        if self.provider == "huggingface" and len(batch) > 1:
+            # Local models run the whole batch as padded generate calls
+            results = await self._huggingface_batch(batch)
+        else:
+            results = await asyncio.gather(
+                *[self._dispatch_chat_completion(messages, **kwargs) for messages, kwargs, _ in batch],
+                return_exceptions=True
+            )
+        
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
             else:
+                future.set_result(result)
+    
+    async def _dispatch_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Route a single chat completion to the configured provider"""
+        try:
+            complete = self._chat_dispatch.get(self.provider)
+            if complete is None:
                 raise ValueError(f"Unsupported provider: {self.provider}")
+            return await complete(messages, **kwargs)
                 
         except Exception as e:
             logger.error(f"Chat completion failed for {self.provider}: {str(e)}")
@@ -222,76 +531,65 @@ class LLMClient:
     
     async def _openai_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """OpenAI chat completion"""
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
-            temperature=kwargs.get('temperature', 0.7),
-            max_tokens=kwargs.get('max_tokens', 1000)
+            **self._sampling(kwargs)
         )
         return response.choices[0].message.content
     
     async def _aws_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """AWS Bedrock chat completion"""
-        import json
-        
         # Convert messages to Claude format
         prompt = self._convert_messages_to_claude_prompt(messages)
         
-        body = {
-            "prompt": prompt,
-            "max_tokens_to_sample": kwargs.get('max_tokens', 1000),
-            "temperature": kwargs.get('temperature', 0.7),
-            "top_p": 0.9,
-        }
+        body = {"prompt": prompt, **self._sampling(kwargs)}
         
-        response = self.client.invoke_model(
+        # boto3 has no asyncio interface, so keep the call off the event loop
+        response = await self._run_blocking(
+            self.client.invoke_model,
             modelId=self.model,
-            body=json.dumps(body),
+            body=_dumps(body),
             contentType='application/json',
             accept='application/json'
         )
         
-        response_body = json.loads(response['body'].read())
+        response_body = json.loads(await self._run_blocking(response['body'].read))
         return response_body.get('completion', '')
     
     async def _groq_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """GROQ chat completion"""
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
-            temperature=kwargs.get('temperature', 0.7),
-            max_tokens=kwargs.get('max_tokens', 1000)
+            **self._sampling(kwargs)
         )
         return response.choices[0].message.content
     
     async def _ollama_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Ollama chat completion"""
-        import requests
+        payload = self._ollama_payload(messages, stream=False, **kwargs)
         
+        session = await self._get_ollama_session()
+        async with session.post(f"{self.base_url}/api/generate", json=payload) as response:
+            if response.status != 200:
+                raise Exception(f"Ollama API error: {await response.text()}")
+            
+            result = await response.json()
+        
+        return result.get('response', '')
+    
+    def _ollama_payload(self, messages: List[Dict[str, str]], stream: bool, **kwargs) -> Dict[str, Any]:
+        """Build the Ollama /api/generate request body"""
         # Convert messages to a single prompt
         prompt = self._convert_messages_to_prompt(messages)
         
-        payload = {
+        return {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": kwargs.get('temperature', 0.7),
-                "num_predict": kwargs.get('max_tokens', 1000)
-            }
+            "stream": stream,
+            "options": self._sampling(kwargs)
         }
-        
-        response = requests.post(
-            f"{self.base_url}/api/generate",
-            json=payload,
-            timeout=60
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Ollama API error: {response.text}")
-        
-        result = response.json()
-        return result.get('response', '')
     
     async def _huggingface_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Hugging Face Transformers chat completion"""
@@ -299,29 +597,66 @@ class LLMClient:
         prompt = self._convert_messages_to_prompt(messages)
         
         # Generate response
-        outputs = self.client(
-            prompt,
-            max_length=len(prompt) + kwargs.get('max_tokens', 200),
-            temperature=kwargs.get('temperature', 0.7),
-            do_sample=True,
-            pad_token_id=self.client.tokenizer.eos_token_id
-        )
+        outputs = await self._run_blocking(self._huggingface_generate, [prompt], **self._sampling(kwargs))
+        return outputs[0]
+    
+    async def _huggingface_batch(self, batch) -> List[Any]:
+        """Generate a micro-batch with one forward pass per distinct sampling setting"""
+        prompts = []
+        groups: Dict[tuple, List[int]] = {}
+        for i, (messages, kwargs, _) in enumerate(batch):
+            prompts.append(self._convert_messages_to_prompt(messages))
+            options = self._sampling(kwargs)
+            groups.setdefault((options['max_new_tokens'], options['temperature']), []).append(i)
         
-        # Extract the generated text (remove the input prompt)
-        generated_text = outputs[0]['generated_text']
-        response = generated_text[len(prompt):].strip()
-        return response
+        results: List[Any] = [None] * len(batch)
+        for (max_new_tokens, temperature), indices in groups.items():
+            try:
+                outputs = await self._run_blocking(
+                    self._huggingface_generate,
+                    [prompts[i] for i in indices],
+                    max_new_tokens=max_new_tokens,
+                    temperature=temperature
+                )
+            except Exception as e:
+                logger.error(f"Chat completion failed for {self.provider}: {str(e)}")
+                outputs = [e] * len(indices)
+            
+            for i, output in zip(indices, outputs):
+                results[i] = output
+        
+        return results
+    
+    def _huggingface_generate(self, prompts: List[str], max_new_tokens: int, temperature: float) -> List[str]:
+        """Tokenize once, generate with the KV cache and decode only the new tokens"""
+        torch = _import_module('torch')
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True, truncation=True).to(self.hf_model.device)
+        
+        with torch.inference_mode():
+            output = self.hf_model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                do_sample=True,
+                num_beams=1,
+                use_cache=True,
+                pad_token_id=self.tokenizer.eos_token_id
+            )
+        
+        # Skip the prompt tokens rather than slicing the decoded string
+        new_tokens = output[:, inputs["input_ids"].shape[1]:]
+        return [text.strip() for text in self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)]
     
     async def _together_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Together AI chat completion"""
         # Convert messages to a single prompt
         prompt = self._convert_messages_to_prompt(messages)
         
-        output = self.client.Complete.create(
+        output = await self._run_blocking(
+            self.client.Complete.create,
             prompt=prompt,
             model=self.model,
-            max_tokens=kwargs.get('max_tokens', 1000),
-            temperature=kwargs.get('temperature', 0.7)
+            **self._sampling(kwargs)
         )
         
         return output['output']['choices'][0]['text']
@@ -331,94 +666,83 @@ class LLMClient:
         # Convert messages to a single prompt
         prompt = self._convert_messages_to_prompt(messages)
         
-        output = self.client.run(
-            self.model,
-            input={
-                "prompt": prompt,
-                "max_new_tokens": kwargs.get('max_tokens', 1000),
-                "temperature": kwargs.get('temperature', 0.7)
-            }
-        )
+        # Replicate returns a generator, so join it in the worker thread too
+        def run():
+            output = self.client.run(
+                self.model,
+                input={"prompt": prompt, **self._sampling(kwargs)}
+            )
+            return ''.join(output)
         
-        # Replicate returns a generator, so we need to join the results
-        return ''.join(output)
+        return await self._run_blocking(run)
     
     async def _local_openai_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Local OpenAI-compatible server chat completion"""
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
-            temperature=kwargs.get('temperature', 0.7),
-            max_tokens=kwargs.get('max_tokens', 1000)
+            **self._sampling(kwargs)
         )
         return response.choices[0].message.content
     
     async def _gemini_chat_completion(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """Google Gemini chat completion"""
-        # Convert messages to Gemini format
-        prompt_parts = []
-        
-        for message in messages:
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            
-            if role == 'system':
-                prompt_parts.append(f"Instructions: {content}")
-            elif role == 'user':
-                prompt_parts.append(f"User: {content}")
-            elif role == 'assistant':
-                prompt_parts.append(f"Assistant: {content}")
-        
-        prompt = "\n\n".join(prompt_parts)
+        prompt = self._convert_messages_to_gemini_prompt(messages)
         
         # Generate response
-        response = self.client.generate_content(
+        response = await self.client.generate_content_async(
             prompt,
-            generation_config={
-                'temperature': kwargs.get('temperature', 0.7),
-                'max_output_tokens': kwargs.get('max_tokens', 1000),
-                'top_p': 0.8,
-                'top_k': 10
-            }
+            generation_config=self._sampling(kwargs)
         )
         
         return response.text
     
+    def _sampling(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay caller temperature/max_tokens on the provider's sampling defaults"""
+        # The shared defaults dict is returned as-is when nothing is overridden; callers must not mutate it
+        if 'temperature' not in kwargs and 'max_tokens' not in kwargs:
+            return self._sampling_defaults
+        
+        options = dict(self._sampling_defaults)
+        if 'temperature' in kwargs:
+            options['temperature'] = kwargs['temperature']
+        if 'max_tokens' in kwargs:
+            options[self._max_tokens_key] = kwargs['max_tokens']
+        return options
+    
     def _convert_messages_to_claude_prompt(self, messages: List[Dict[str, str]]) -> str:
         """Convert OpenAI-style messages to Claude prompt format"""
-        prompt_parts = []
-        
-        for message in messages:
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            
-            if role == 'system':
-                prompt_parts.append(f"System: {content}")
-            elif role == 'user':
-                prompt_parts.append(f"Human: {content}")
-            elif role == 'assistant':
-                prompt_parts.append(f"Assistant: {content}")
-        
-        prompt_parts.append("Assistant:")
-        return "\n\n".join(prompt_parts)
+        return self._join_prompt(*self._normalize(messages), self._CLAUDE_ROLE_PREFIX)
     
     def _convert_messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         """Convert OpenAI-style messages to a simple prompt format for most open source models"""
-        prompt_parts = []
-        
+        return self._join_prompt(*self._normalize(messages), self._SIMPLE_ROLE_PREFIX)
+    
+    def _convert_messages_to_gemini_prompt(self, messages: List[Dict[str, str]]) -> str:
+        """Convert OpenAI-style messages to Gemini prompt format"""
+        return self._join_prompt(*self._normalize(messages), self._GEMINI_ROLE_PREFIX, cue=None)
+    
+    @staticmethod
+    def _normalize(messages: List[Dict[str, str]]) -> Tuple[List[str], List[str]]:
+        """Split messages into parallel role and content lists in one pass"""
+        roles = []
+        contents = []
         for message in messages:
-            role = message.get('role', 'user')
-            content = message.get('content', '')
-            
-            if role == 'system':
-                prompt_parts.append(f"System: {content}")
-            elif role == 'user':
-                prompt_parts.append(f"User: {content}")
-            elif role == 'assistant':
-                prompt_parts.append(f"Assistant: {content}")
-        
-        prompt_parts.append("Assistant:")
-        return "\n\n".join(prompt_parts)
+            roles.append(message.get('role', 'user'))
+            contents.append(message.get('content', ''))
+        return roles, contents
+    
+    @staticmethod
+    def _join_prompt(roles: List[str], contents: List[str], role_prefix: Dict[str, str], cue: Optional[str] = "Assistant:") -> str:
+        """Render messages with per-role prefixes in a single join, ending with the cue if given"""
+        parts = (
+            role_prefix[role] + content
+            for role, content in zip(roles, contents)
+            if role in role_prefix
+        )
+        if cue is not None:
+            parts = chain(parts, (cue,))
+        return "\n\n".join(parts)
     
     def get_provider_info(self) -> Dict[str, Any]:
         """Get information about the current provider"""
@@ -428,16 +752,17 @@ class LLMClient:
             'available': self.client is not None
         }
 
-# Global LLM client instance
-llm_client = None
+# Global LLM client instances, one per provider
+_clients: Dict[str, LLMClient] = {}
 
-def get_llm_client() -> LLMClient:
-    """Get or create the global LLM client instance"""
-    global llm_client
-    if llm_client is None:
-        llm_client = LLMClient()
-    return llm_client
+def get_llm_client(provider: Optional[str] = None) -> LLMClient:
+    """Get or create the shared LLM client for a provider (defaults to the configured one)"""
+    key = (provider or settings.llm_provider).lower()
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = LLMClient(key)
+    return client
 
-def initialize_llm_client() -> LLMClient:
+def initialize_llm_client(provider: Optional[str] = None) -> LLMClient:
     """Initialize and return a new LLM client instance"""
-    return LLMClient()
+    return LLMClient(provider)
@@ -7,109 +7,229 @@ It can be run as a CLI tool or as a web server.
 """
 
 import asyncio
-import argparse
 import json
-from orchestrator import AgenticOrchestrator
-from models import QueryRequest
+import os
+import sys
+import time
+from operator import attrgetter
+from typing import Any, Callable, Dict
 from config import settings
 import logging
 
-# Configure logging
+# Configure logging; unknown level names fall back to INFO
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=_LEVELS.get(settings.log_level.upper(), logging.INFO),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    style='%'
 )
 
+# The format never shows thread/process info, so don't collect it on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logger = logging.getLogger(__name__)
 
-async def run_cli_query(query: str, max_results: int = 10):
+# Agent type string of an AgentResponse, applied in C by map()
+_agent_name = attrgetter('agent_type.value')
+
+# Shared orchestrator so agents and their connection pools persist across queries
+_orchestrator = None
+
+def get_orchestrator() -> "AgenticOrchestrator":
+    """Get or create the process-wide orchestrator"""
+    global _orchestrator
+    if _orchestrator is None:
+        # Imported here so `serve` never loads the agent stack in this process
+        from orchestrator import AgenticOrchestrator
+        _orchestrator = AgenticOrchestrator()
+    return _orchestrator
+
+def run_async(coro):
+    """Run a coroutine on uvloop when it is installed, otherwise on the default asyncio loop"""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+async def run_cli_query(query: str, max_results: int = 10, json_mode: bool = False):
     """Run a query from the command line"""
-    orchestrator = AgenticOrchestrator()
+    from models import QueryRequest
+    
+    orchestrator = get_orchestrator()
+    start_time = time.time()
+    if __debug__:
+        request = QueryRequest(prompt=query, max_results=max_results)
+    else:
+        # Under python -O the CLI arguments are trusted and validation is skipped
+        request = QueryRequest.model_construct(prompt=query, max_results=max_results)
     
-    print(f"\n🤖 Processing query: {query}")
-    print("=" * 60)
+    if json_mode:
+        # Machine-readable output: one JSON document, no pretty-printing
+        response = await orchestrator.process_query(request)
+        try:
+            import orjson
+        except ImportError:
+            sys.stdout.write(json.dumps(response.model_dump(mode='json')) + "\n")
+        else:
+            sys.stdout.buffer.write(orjson.dumps(response.model_dump(mode='json'), option=orjson.OPT_APPEND_NEWLINE))
+        return
     
-    request = QueryRequest(prompt=query, max_results=max_results)
-    response = await orchestrator.process_query(request)
+    # Output is collected per section and written once; flushed after every agent
+    buf = []
+    w = buf.append
     
-    print(f"\n📊 Summary:")
-    print(f"Query: {response.query}")
-    print(f"Agents Used: {', '.join([agent.value for agent in response.agents_used])}")
-    print(f"Total Results: {response.total_results}")
-    print(f"Execution Time: {response.execution_time:.2f}s")
-    print(f"Summary: {response.summary}")
+    def flush():
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
+        buf.clear()
     
-    print(f"\n📋 Detailed Results:")
-    print("=" * 60)
+    rule = "=" * 60
+    w(f"\n🤖 Processing query: {query}\n{rule}\n")
+    w(f"\n📋 Detailed Results:\n{rule}\n")
+    flush()
     
-    for result in response.results:
-        print(f"\n🔍 {result.agent_type.value.upper()} Agent:")
+    # Print each agent's results as soon as it finishes instead of waiting for the slowest
+    results = []
+    async for result in orchestrator.process_query_stream(request):
+        results.append(result)
+        # Interned so the _HANDLERS lookup hits the identity fast path
+        agent_type = sys.intern(result.agent_type.value)
+        handler = _HANDLERS.get(agent_type, _fmt_generic)
+        w(f"\n🔍 {agent_type.upper()} Agent:\n")
         
         if result.success:
             if result.data:
                 for i, item in enumerate(result.data, 1):
-                    print(f"\n  Result {i}:")
-                    print_result_item(item, result.agent_type.value, indent="    ")
+                    w(f"\n  Result {i}:\n")
+                    handler(item, "    ", w)
             else:
-                print("    No results found")
+                w("    No results found\n")
         else:
-            print(f"    ❌ Error: {result.error}")
+            w(f"    ❌ Error: {result.error}\n")
+        flush()
+    
+    summary = await orchestrator.summarize(query, results)
+    total_results = sum(len(result.data) for result in results if result.success)
+    
+    w(
+        f"\n📊 Summary:\n"
+        f"Query: {query}\n"
+        f"Agents Used: {', '.join(map(_agent_name, results))}\n"
+        f"Total Results: {total_results}\n"
+        f"Execution Time: {time.time() - start_time:.2f}s\n"
+        f"Summary: {summary}\n"
+    )
+    flush()
 
-def print_result_item(item: dict, agent_type: str, indent: str = ""):
+# Long string fields are cut to _TRUNC characters plus an ellipsis
+_TRUNC = 100
+_ELLIPSIS = "..."
+
+def _shorten(value):
+    """Truncate long strings for display; other values pass through"""
+    return value[:_TRUNC] + _ELLIPSIS if type(value) is str and len(value) > _TRUNC else value
+
+def _fmt_jira(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format a JIRA issue"""
+    get = item.get
+    text = (
+        f"{indent}Key: {get('key', 'N/A')}\n"
+        f"{indent}Summary: {get('summary', 'N/A')}\n"
+        f"{indent}Status: {get('status', 'N/A')}\n"
+        f"{indent}Priority: {get('priority', 'N/A')}\n"
+        f"{indent}Assignee: {get('assignee', 'Unassigned')}\n"
+    )
+    if url := get('url'):
+        text += f"{indent}URL: {url}\n"
+    write(text)
+
+def _fmt_github(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format a GitHub item"""
+    get = item.get
+    text = (
+        f"{indent}Name: {get('name', 'N/A')}\n"
+        f"{indent}Type: {get('type', 'N/A')}\n"
+        f"{indent}Author: {get('author', 'N/A')}\n"
+        f"{indent}Description: {_shorten(get('description', 'N/A'))}\n"
+    )
+    if url := get('url'):
+        text += f"{indent}URL: {url}\n"
+    write(text)
+
+def _fmt_filesystem(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format a file system entry"""
+    get = item.get
+    write(
+        f"{indent}Name: {get('name', 'N/A')}\n"
+        f"{indent}Path: {get('path', 'N/A')}\n"
+        f"{indent}Type: {get('type', 'N/A')}\n"
+        f"{indent}Size: {get('size', 'N/A')} bytes\n"
+        f"{indent}Modified: {get('modified', 'N/A')}\n"
+    )
+
+def _fmt_video(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format a video"""
+    get = item.get
+    text = (
+        f"{indent}Title: {get('title', 'N/A')}\n"
+        f"{indent}Duration: {get('duration', 'N/A')}\n"
+        f"{indent}Platform: {get('platform', 'N/A')}\n"
+    )
+    if url := get('url'):
+        text += f"{indent}URL: {url}\n"
+    write(text)
+
+def _fmt_s3(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format an S3 object"""
+    get = item.get
+    write(
+        f"{indent}Key: {get('key', 'N/A')}\n"
+        f"{indent}Bucket: {get('bucket', 'N/A')}\n"
+        f"{indent}Size: {get('size', 'N/A')} bytes\n"
+        f"{indent}Last Modified: {get('last_modified', 'N/A')}\n"
+    )
+
+def _fmt_url(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format a fetched URL"""
+    get = item.get
+    write(
+        f"{indent}URL: {get('url', 'N/A')}\n"
+        f"{indent}Title: {get('title', 'N/A')}\n"
+        f"{indent}Status: {get('status_code', 'N/A')}\n"
+        f"{indent}Content Type: {get('content_type', 'N/A')}\n"
+    )
+
+def _fmt_generic(item: dict, indent: str, write: Callable[[str], Any]):
+    """Format an item of unknown type, truncating long strings"""
+    write("".join(f"{indent}{key}: {_shorten(value)}\n" for key, value in item.items()))
+
+# Agent type -> item handler; one dict lookup instead of an if/elif ladder
+_HANDLERS: Dict[str, Callable[[dict, str, Callable[[str], Any]], None]] = {
+    'jira': _fmt_jira,
+    'github': _fmt_github,
+    'filesystem': _fmt_filesystem,
+    'video': _fmt_video,
+    's3': _fmt_s3,
+    'url': _fmt_url,
+}
+
+def print_result_item(item: dict, agent_type: str, indent: str = "", write: Callable[[str], Any] = None):
     """Print a result item in a formatted way"""
-    if agent_type == 'jira':
-        print(f"{indent}Key: {item.get('key', 'N/A')}")
-        print(f"{indent}Summary: {item.get('summary', 'N/A')}")
-        print(f"{indent}Status: {item.get('status', 'N/A')}")
-        print(f"{indent}Priority: {item.get('priority', 'N/A')}")
-        print(f"{indent}Assignee: {item.get('assignee', 'Unassigned')}")
-        if item.get('url'):
-            print(f"{indent}URL: {item['url']}")
-    
-    elif agent_type == 'github':
-        print(f"{indent}Name: {item.get('name', 'N/A')}")
-        print(f"{indent}Type: {item.get('type', 'N/A')}")
-        print(f"{indent}Author: {item.get('author', 'N/A')}")
-        print(f"{indent}Description: {item.get('description', 'N/A')[:100]}...")
-        if item.get('url'):
-            print(f"{indent}URL: {item['url']}")
-    
-    elif agent_type == 'filesystem':
-        print(f"{indent}Name: {item.get('name', 'N/A')}")
-        print(f"{indent}Path: {item.get('path', 'N/A')}")
-        print(f"{indent}Type: {item.get('type', 'N/A')}")
-        print(f"{indent}Size: {item.get('size', 'N/A')} bytes")
-        print(f"{indent}Modified: {item.get('modified', 'N/A')}")
-    
-    elif agent_type == 'video':
-        print(f"{indent}Title: {item.get('title', 'N/A')}")
-        print(f"{indent}Duration: {item.get('duration', 'N/A')}")
-        print(f"{indent}Platform: {item.get('platform', 'N/A')}")
-        if item.get('url'):
-            print(f"{indent}URL: {item['url']}")
-    
-    elif agent_type == 's3':
-        print(f"{indent}Key: {item.get('key', 'N/A')}")
-        print(f"{indent}Bucket: {item.get('bucket', 'N/A')}")
-        print(f"{indent}Size: {item.get('size', 'N/A')} bytes")
-        print(f"{indent}Last Modified: {item.get('last_modified', 'N/A')}")
-    
-    elif agent_type == 'url':
-        print(f"{indent}URL: {item.get('url', 'N/A')}")
-        print(f"{indent}Title: {item.get('title', 'N/A')}")
-        print(f"{indent}Status: {item.get('status_code', 'N/A')}")
-        print(f"{indent}Content Type: {item.get('content_type', 'N/A')}")
-    
-    else:
-        # Generic printing for unknown types
-        for key, value in item.items():
-            if isinstance(value, str) and len(value) > 100:
-                value = value[:100] + "..."
-            print(f"{indent}{key}: {value}")
+    _HANDLERS.get(agent_type, _fmt_generic)(item, indent, write or sys.stdout.write)
 
 async def run_health_check():
     """Run a health check on all agents"""
-    orchestrator = AgenticOrchestrator()
+    orchestrator = get_orchestrator()
     
     print("\n🏥 Running Health Check...")
     print("=" * 40)
@@ -126,24 +246,56 @@ async def run_health_check():
         if status.get('error'):
             print(f"    Error: {status['error']}")
 
-def run_web_server():
+def run_web_server(workers: int = None):
     """Run the web server"""
     import uvicorn
-    from api import app
+    
+    workers = settings.app_workers if workers is None else workers
+    workers = workers or os.cpu_count() or 1
     
     print(f"\n🚀 Starting Agentic AI Workflows Web Server...")
     print(f"Server will be available at: http://{settings.app_host}:{settings.app_port}")
+    print(f"Workers: {workers}")
     print("Press Ctrl+C to stop the server")
     
+    # Prefer uvloop + httptools when installed; fall back to uvicorn's pure-Python defaults
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_options = {"loop": "uvloop", "http": "httptools"}
+    except ImportError:
+        loop_options = {}
+    
+    # With several workers uvicorn binds the socket once in the parent and every
+    # worker process accepts from it; workers need the app as an import string
+    if workers > 1:
+        app = "api:app"
+    else:
+        from api import app
+    
     uvicorn.run(
         app,
         host=settings.app_host,
         port=settings.app_port,
-        log_level=settings.log_level.lower()
+        workers=workers,
+        backlog=2048,
+        log_level=settings.log_level.lower(),
+        interface="asgi3",
+        **loop_options
     )
 
 def main():
     """Main entry point"""
+    # Plain `serve` (or no command) needs no argument parsing
+    argv = sys.argv[1:]
+    if not argv or argv == ['serve']:
+        if not argv:
+            print("No command specified. Starting web server...")
+        run_web_server()
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Agentic AI Workflows - Multi-agent information retrieval system"
     )
@@ -154,38 +306,60 @@ def main():
     query_parser = subparsers.add_parser('query', help='Run a query using the agentic workflow')
     query_parser.add_argument('prompt', help='Natural language query')
     query_parser.add_argument('--max-results', type=int, default=10, help='Maximum number of results per agent')
+    query_parser.add_argument('--json', action='store_true', help='Print the full response as JSON')
     
     # Health check command
     subparsers.add_parser('health', help='Check the health of all agents')
     
     # Web server command
     server_parser = subparsers.add_parser('serve', help='Start the web server')
+    server_parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (0 = one per CPU core)')
     
     # Interactive mode
     subparsers.add_parser('interactive', help='Start interactive mode')
     
     args = parser.parse_args()
     
-    if args.command == 'query':
-        asyncio.run(run_cli_query(args.prompt, args.max_results))
-    
-    elif args.command == 'health':
-        asyncio.run(run_health_check())
-    
-    elif args.command == 'serve':
-        run_web_server()
+    if args.command == 'serve':
+        run_web_server(args.workers)
     
-    elif args.command == 'interactive':
-        asyncio.run(interactive_mode())
+    elif args.command in ('query', 'health', 'interactive'):
+        # One event loop for the whole process; the orchestrator's pools live on it
+        run_async(run_command(args))
     
     else:
         # Default to web server if no command specified
         print("No command specified. Starting web server...")
         run_web_server()
 
+async def run_command(args):
+    """Dispatch an async CLI command, then release the shared orchestrator's connections"""
+    try:
+        if args.command == 'query':
+            await run_cli_query(args.prompt, args.max_results, args.json)
+        
+        elif args.command == 'health':
+            await run_health_check()
+        
+        elif args.command == 'interactive':
+            await interactive_mode()
+    finally:
+        if _orchestrator is not None:
+            await _orchestrator.aclose()
+
+async def read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    try:
+        from aioconsole import ainput
+    except ImportError:
+        return await asyncio.to_thread(input, prompt)
+    return await ainput(prompt)
+
 async def interactive_mode():
     """Run in interactive mode"""
-    orchestrator = AgenticOrchestrator()
+    # Build the orchestrator up front so the first query doesn't pay for agent setup,
+    # and warm the LLM while the user is still typing
+    warmup = asyncio.create_task(get_orchestrator().warmup())
     
     print("\n🤖 Agentic AI Workflows - Interactive Mode")
     print("=" * 50)
@@ -197,7 +371,7 @@ async def interactive_mode():
     
     while True:
         try:
-            query = input("\n💬 Query: ").strip()
+            query = (await read_input("\n💬 Query: ")).strip()
             
             if query.lower() in ['quit', 'exit', 'q']:
                 print("Goodbye! 👋")
@@ -222,6 +396,9 @@ async def interactive_mode():
             break
         except Exception as e:
             print(f"❌ Error: {str(e)}")
+    
+    # Leaving before the ping answered; don't hold up shutdown for it
+    warmup.cancel()
 
 def print_help_examples():
     """Print help examples"""
@@ -6,8 +6,19 @@ This version works with available dependencies and provides real functionality
 
 import asyncio
 import argparse
+import gzip
+import hashlib
 import json
-from typing import List, Dict, Any
+import mmap
+import os
+import re
+import stat
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlparse
+from typing import List, Dict, Any, Iterator, Optional
 import logging
 import time
 
@@ -19,63 +30,163 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Files larger than this are only matched by name
+MAX_CONTENT_BYTES = 10 * 1024 * 1024
+# Content matches are only looked for in the first MAX_SCAN_BYTES of a file
+MAX_SCAN_BYTES = 8 * 1024 * 1024
+
+# Readahead hints for the content scan (Linux/BSD only)
+_FADVISE = hasattr(os, 'posix_fadvise')
+_MADVISE = hasattr(mmap, 'MADV_SEQUENTIAL')
+
+# Extensions the filesystem agent searches
+EXTS = frozenset({'.py', '.txt', '.md', '.json', '.yml', '.yaml'})
+
+# Directories never worth descending into (VCS metadata, virtualenvs, caches, build output)
+SKIP_DIRS = frozenset({
+    '.git', '.venv', 'venv', 'env', 'node_modules', '__pycache__', '.mypy_cache',
+    '.pytest_cache', 'site-packages', 'dist', 'build', '.tox'
+})
+
+def _load_gitignore(root: str):
+    """Parse root/.gitignore into a PathSpec when pathspec is installed"""
+    try:
+        import pathspec
+        with open(os.path.join(root, '.gitignore'), encoding='utf-8') as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f)
+    except (ImportError, OSError):
+        return None
+
+def _iter_files(root: str, ignore=None):
+    """Yield DirEntry objects for searchable files below root in one directory walk"""
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS or (ignore is not None and ignore.match_file(entry.path + '/')):
+                        continue
+                    yield from _iter_files(entry.path, ignore)
+                elif entry.is_file() and os.path.splitext(entry.name)[1] in EXTS:
+                    if ignore is not None and ignore.match_file(entry.path):
+                        continue
+                    yield entry  # DirEntry caches its stat result
+    except OSError:
+        return
+
+def _match_file(entry: os.DirEntry, query_lower: str, query_re: Optional[re.Pattern], query_fold: str):
+    """Return a result dict if the file's name or content matches, else None"""
+    file_path = entry.path
+    file_name = entry.name
+    size = entry.stat().st_size
+    # A filename hit needs no read at all
+    if query_lower in file_name.lower():
+        return {
+            'file_path': file_path,
+            'file_name': file_name,
+            'size': size,
+            'match_type': 'filename',
+            'preview': ''
+        }
+    if not 0 < size <= MAX_CONTENT_BYTES:
+        return None
+    
+    preview = None
+    # Scan the raw mapped bytes once; text is decoded only for hits
+    with open(file_path, 'rb') as f:
+        fd = f.fileno()
+        if _FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            if _MADVISE:
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if query_re is not None:
+                match = query_re.search(mm, 0, MAX_SCAN_BYTES)
+                if match is not None:
+                    # 200-byte window around the hit rather than the file header
+                    start = max(0, match.start() - 80)
+                    end = start + 200
+                    window = mm[start:end].decode('utf-8', 'ignore')
+                    preview = ('...' if start else '') + window + ('...' if end < size else '')
+            else:
+                # Bytes IGNORECASE folds ASCII only, so non-ASCII queries compare decoded text
+                text = mm[:MAX_SCAN_BYTES].decode('utf-8', 'ignore')
+                pos = text.casefold().find(query_fold)
+                if pos >= 0:
+                    start = max(0, min(pos, len(text)) - 80)
+                    end = start + 200
+                    preview = ('...' if start else '') + text[start:end] + ('...' if end < len(text) else '')
+        # One-off scan; don't let it evict other workloads from the page cache
+        if _FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    if preview is None:
+        return None
+    return {
+        'file_path': file_path,
+        'file_name': file_name,
+        'size': size,
+        'match_type': 'content',
+        'preview': preview
+    }
+
+# Per-file scans run on their own pool; the agent's scan loop already holds
+# a worker of the orchestrator's executor and must not wait on that pool
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+SCAN_WINDOW = SCAN_WORKERS * 4
+_SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix='fs-scan')
+
+def _matches(futures) -> Iterator[Dict[str, Any]]:
+    """Yield the results of finished _match_file futures, skipping misses and failures"""
+    for future in futures:
+        try:
+            result = future.result()
+        except Exception:
+            continue
+        if result is not None:
+            yield result
+
 # Import only what we need
 try:
     from config import settings
     from models import QueryRequest, WorkflowResponse, AgentResponse, AgentType
     from llm_client import get_llm_client
+    import aiohttp
 except ImportError as e:
-    logger.error(f"Import error: {e}")
+    logger.error("Import error: %s", e)
     print("Some dependencies are missing. Using fallback mode.")
 
+# orjson parses straight from bytes in C; stdlib json accepts bytes too
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 # Simple agent implementations that work without external dependencies
 class WorkingFileSystemAgent:
     """File system agent that actually searches files"""
     
-    def __init__(self):
+    def __init__(self, executor: ThreadPoolExecutor = None):
         self.agent_type = AgentType.FILESYSTEM
+        self.executor = executor
+        self.ignore = _load_gitignore(".")
         
     async def search(self, query: str, max_results: int = 10) -> AgentResponse:
         """Search local files"""
-        import os
-        import glob
-        from pathlib import Path
-        
+        # File I/O blocks, so the scan runs off the event loop while the web agents proceed
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._search_sync, query, max_results)
+        return await asyncio.to_thread(self._search_sync, query, max_results)
+    
+    def _search_sync(self, query: str, max_results: int) -> AgentResponse:
+        """Scan local files for the query on a worker thread"""
         try:
-            results = []
             search_paths = ["."]  # Search current directory
-            extensions = [".py", ".txt", ".md", ".json", ".yml", ".yaml"]
-            
-            for search_path in search_paths:
-                for ext in extensions:
-                    pattern = os.path.join(search_path, f"**/*{ext}")
-                    files = glob.glob(pattern, recursive=True)
-                    
-                    for file_path in files[:max_results]:
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                if query.lower() in content.lower() or query.lower() in os.path.basename(file_path).lower():
-                                    results.append({
-                                        'file_path': file_path,
-                                        'file_name': os.path.basename(file_path),
-                                        'size': os.path.getsize(file_path),
-                                        'match_type': 'content' if query.lower() in content.lower() else 'filename',
-                                        'preview': content[:200] + '...' if len(content) > 200 else content
-                                    })
-                        except Exception:
-                            continue
-                            
-                        if len(results) >= max_results:
-                            break
-                    
-                    if len(results) >= max_results:
-                        break
-                        
-                if len(results) >= max_results:
-                    break
+            # The scan stops as soon as max_results matches have been produced
+            results = list(islice(self._scan(query, search_paths), max_results))
             
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=True,
                 data=results,
@@ -83,27 +194,70 @@ class WorkingFileSystemAgent:
             )
             
         except Exception as e:
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=False,
                 data=[],
                 error=str(e)
             )
+    
+    def _scan(self, query: str, search_paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """Yield a result dict for every file under search_paths matching the query"""
+        query_lower = query.lower()
+        query_fold = query.casefold()
+        # The bytes pattern only serves ASCII queries; others are matched on casefolded text
+        query_re = re.compile(re.escape(query.encode()), re.IGNORECASE) if query.isascii() else None
+        
+        pending = set()
+        try:
+            for search_path in search_paths:
+                for entry in _iter_files(search_path, self.ignore):
+                    pending.add(_SCAN_POOL.submit(_match_file, entry, query_lower, query_re, query_fold))
+                    # Bound the in-flight window so matches stream out while the walk continues
+                    if len(pending) >= SCAN_WINDOW:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from _matches(done)
+            yield from _matches(as_completed(pending))
+        finally:
+            # Runs when islice stops early: drop scans that haven't started
+            for future in pending:
+                future.cancel()
+
+# Web agents share one aiohttp session; requests per agent are bounded and
+# transient failures (429/5xx) are retried with exponential backoff
+HTTP_CONCURRENCY = 64
+HTTP_RETRIES = 2
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+async def _fetch(session, semaphore: asyncio.Semaphore, url: str, read):
+    """GET a URL and return (response, body) where body comes from read(response)"""
+    for attempt in range(HTTP_RETRIES + 1):
+        async with semaphore:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return response, await read(response)
+        await asyncio.sleep(0.2 * 2 ** attempt)
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Extract and memoize the network location of a URL"""
+    return urlparse(url).netloc
+
+async def _read_json(response):
+    """Decode a JSON response body without an intermediate str"""
+    return _loads(await response.read())
 
 class WorkingURLAgent:
     """URL agent that fetches web content"""
     
-    def __init__(self):
+    def __init__(self, session=None):
         self.agent_type = AgentType.URL
+        self.session = session
+        self.semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
         
     async def search(self, query: str, max_results: int = 10) -> AgentResponse:
         """Fetch content from URLs"""
-        import requests
-        from urllib.parse import urlparse
-        
         try:
-            results = []
-            
             # If query looks like a URL, fetch it directly
             if query.startswith(('http://', 'https://')):
                 urls = [query]
@@ -114,26 +268,29 @@ class WorkingURLAgent:
                     "https://api.github.com/zen",  # GitHub zen
                 ]
             
-            for url in urls[:max_results]:
+            async def fetch(url):
                 try:
-                    response = requests.get(url, timeout=5)
-                    if response.status_code == 200:
-                        content = response.text[:1000]  # Limit content
-                        results.append({
+                    response, text = await _fetch(self.session, self.semaphore, url, lambda r: r.text())
+                    if response.status == 200:
+                        return {
                             'url': url,
-                            'status_code': response.status_code,
+                            'status_code': response.status,
                             'content_type': response.headers.get('content-type', 'unknown'),
-                            'content_preview': content,
-                            'title': f"Content from {urlparse(url).netloc}"
-                        })
+                            'content_preview': text[:1000],  # Limit content
+                            'title': f"Content from {_netloc(url)}"
+                        }
                 except Exception as e:
-                    results.append({
+                    return {
                         'url': url,
                         'error': str(e),
                         'status': 'failed'
-                    })
+                    }
             
-            return AgentResponse(
+            # All URLs are fetched concurrently; non-200 responses are dropped
+            fetched = await asyncio.gather(*[fetch(url) for url in urls[:max_results]])
+            results = [item for item in fetched if item is not None]
+            
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=True,
                 data=results,
@@ -141,7 +298,7 @@ class WorkingURLAgent:
             )
             
         except Exception as e:
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=False,
                 data=[],
@@ -151,16 +308,14 @@ class WorkingURLAgent:
 class WorkingAPIAgent:
     """API agent that makes HTTP requests"""
     
-    def __init__(self):
+    def __init__(self, session=None):
         self.agent_type = AgentType.API
+        self.session = session
+        self.semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
         
     async def search(self, query: str, max_results: int = 10) -> AgentResponse:
         """Make API requests"""
-        import requests
-        
         try:
-            results = []
-            
             # Test with some public APIs
             apis = [
                 "https://httpbin.org/get",
@@ -168,25 +323,27 @@ class WorkingAPIAgent:
                 "https://api.github.com/repos/microsoft/vscode"
             ]
             
-            for api_url in apis[:max_results]:
+            async def fetch(api_url):
                 try:
-                    response = requests.get(api_url, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results.append({
+                    response, data = await _fetch(self.session, self.semaphore, api_url, _read_json)
+                    if response.status == 200:
+                        return {
                             'api_url': api_url,
-                            'status_code': response.status_code,
+                            'status_code': response.status,
                             'data': data,
                             'query_relevance': query.lower() in str(data).lower()
-                        })
+                        }
                 except Exception as e:
-                    results.append({
+                    return {
                         'api_url': api_url,
                         'error': str(e),
                         'status': 'failed'
-                    })
+                    }
             
-            return AgentResponse(
+            fetched = await asyncio.gather(*[fetch(api_url) for api_url in apis[:max_results]])
+            results = [item for item in fetched if item is not None]
+            
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=True,
                 data=results,
@@ -194,64 +351,90 @@ class WorkingAPIAgent:
             )
             
         except Exception as e:
-            return AgentResponse(
+            return AgentResponse.model_construct(
                 agent_type=self.agent_type,
                 success=False,
                 data=[],
                 error=str(e)
             )
 
+# Keywords routing a query to each agent
+_FS_RE = re.compile(r'file|folder|directory|local|search', re.IGNORECASE)
+_URL_RE = re.compile(r'url|website|web|http|link', re.IGNORECASE)
+_API_RE = re.compile(r'api|request|endpoint|service', re.IGNORECASE)
+
 class WorkingOrchestrator:
     """Working orchestrator with available agents"""
     
+    SUMMARY_CACHE_MAXSIZE = 512
+    
     def __init__(self):
+        # One pool shared by every agent that does blocking file I/O
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
         self.agents = {
-            AgentType.FILESYSTEM: WorkingFileSystemAgent(),
+            AgentType.FILESYSTEM: WorkingFileSystemAgent(self.executor),
             AgentType.URL: WorkingURLAgent(),
             AgentType.API: WorkingAPIAgent()
         }
+        # The agent set is fixed after construction; /health returns this as-is
+        self.agent_keys = tuple(self.agents)
         
         # Try to initialize LLM client
         try:
             self.llm_client = get_llm_client()
         except Exception as e:
-            logger.warning(f"LLM client not available: {e}")
+            logger.warning("LLM client not available: %s", e)
             self.llm_client = None
+        
+        self.session = None
+        self._summary_cache: "OrderedDict[str, str]" = OrderedDict()
+    
+    async def startup(self):
+        """Open the HTTP session shared by the web agents"""
+        if self.session is None or self.session.closed:
+            # Created inside the running loop; keep-alive sockets and DNS cache are shared by all agents
+            connector = aiohttp.TCPConnector(limit=200, limit_per_host=32, keepalive_timeout=60, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector)
+            for agent in self.agents.values():
+                if hasattr(agent, 'session'):
+                    agent.session = self.session
+    
+    async def warmup(self):
+        """Warm up the LLM client when LLM_WARMUP is enabled"""
+        if self.llm_client is not None and self.llm_client.warmup_on_start:
+            await self.llm_client.warmup()
+    
+    async def shutdown(self):
+        """Close the shared HTTP session and the LLM client's connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.llm_client is not None:
+            await self.llm_client.aclose()
     
     async def process_query(self, request: QueryRequest) -> WorkflowResponse:
         """Process a query using available agents"""
         start_time = time.time()
         
         try:
+            await self.startup()
+            
             # Determine relevant agents (simple keyword matching)
             relevant_agents = self._determine_relevant_agents(request.prompt)
             
             if not relevant_agents:
                 relevant_agents = list(self.agents.keys())  # Use all agents
             
-            # Execute searches in parallel
-            tasks = []
-            for agent_type in relevant_agents:
-                if agent_type in self.agents:
-                    task = asyncio.create_task(
-                        self.agents[agent_type].search(request.prompt, request.max_results)
-                    )
-                    tasks.append((agent_type, task))
-            
-            # Wait for results
-            results = []
-            for agent_type, task in tasks:
-                try:
-                    result = await task
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Agent {agent_type.value} failed: {str(e)}")
-                    results.append(AgentResponse(
-                        agent_type=agent_type,
-                        success=False,
-                        data=[],
-                        error=str(e)
-                    ))
+            # Execute searches in parallel; failures come back as exceptions in place
+            agent_types = [agent_type for agent_type in relevant_agents if agent_type in self.agents]
+            raw = await asyncio.gather(
+                *[self.agents[agent_type].search(request.prompt, request.max_results) for agent_type in agent_types],
+                return_exceptions=True
+            )
+            results = [
+                self._error_response(agent_type, result) if isinstance(result, Exception) else result
+                for agent_type, result in zip(agent_types, raw)
+            ]
             
             # Generate summary
             summary = await self._generate_summary(request.prompt, results)
@@ -259,7 +442,8 @@ class WorkingOrchestrator:
             # Calculate total results
             total_results = sum(len(result.data) for result in results if result.success)
             
-            return WorkflowResponse(
+            # Built from agent responses that are already models; no need to validate them again
+            return WorkflowResponse.model_construct(
                 query=request.prompt,
                 agents_used=relevant_agents,
                 results=results,
@@ -269,8 +453,8 @@ class WorkingOrchestrator:
             )
             
         except Exception as e:
-            logger.error(f"Query processing failed: {str(e)}")
-            return WorkflowResponse(
+            logger.error("Query processing failed: %s", e)
+            return WorkflowResponse.model_construct(
                 query=request.prompt,
                 agents_used=[],
                 results=[],
@@ -279,21 +463,28 @@ class WorkingOrchestrator:
                 execution_time=time.time() - start_time
             )
     
+    def _error_response(self, agent_type: AgentType, error: Exception) -> AgentResponse:
+        """Log an agent failure and wrap it as an unsuccessful response"""
+        logger.error("Agent %s failed: %s", agent_type.value, error)
+        return AgentResponse.model_construct(
+            agent_type=agent_type,
+            success=False,
+            data=[],
+            error=str(error)
+        )
+    
     def _determine_relevant_agents(self, query: str) -> List[AgentType]:
         """Determine relevant agents based on keywords"""
-        query_lower = query.lower()
         relevant = []
         
-        # File system keywords
-        if any(word in query_lower for word in ['file', 'folder', 'directory', 'local', 'search']):
+        # One C-level scan per agent; substring semantics match the old keyword lists
+        if _FS_RE.search(query):
             relevant.append(AgentType.FILESYSTEM)
         
-        # URL keywords
-        if any(word in query_lower for word in ['url', 'website', 'web', 'http', 'link']):
+        if _URL_RE.search(query):
             relevant.append(AgentType.URL)
         
-        # API keywords
-        if any(word in query_lower for word in ['api', 'request', 'endpoint', 'service']):
+        if _API_RE.search(query):
             relevant.append(AgentType.API)
         
         return relevant
@@ -310,11 +501,21 @@ class WorkingOrchestrator:
                     else:
                         results_text.append(f"{result.agent_type.value}: Error - {result.error}")
                 
+                # Repeated queries with the same outcome reuse the earlier summary
+                key = hashlib.blake2b(f"{query}|{'|'.join(sorted(results_text))}".encode(), digest_size=16).hexdigest()
+                if key in self._summary_cache:
+                    self._summary_cache.move_to_end(key)
+                    return self._summary_cache[key]
+                
                 prompt = f"Summarize these search results for query '{query}': {'; '.join(results_text)}"
                 summary = await self.llm_client.chat_completion([{"role": "user", "content": prompt}], max_tokens=150)
+                
+                self._summary_cache[key] = summary
+                if len(self._summary_cache) > self.SUMMARY_CACHE_MAXSIZE:
+                    self._summary_cache.popitem(last=False)
                 return summary
             except Exception as e:
-                logger.warning(f"LLM summary failed: {e}")
+                logger.warning("LLM summary failed: %s", e)
         
         # Fallback to basic summary
         successful_agents = [r.agent_type.value for r in results if r.success]
@@ -322,15 +523,37 @@ class WorkingOrchestrator:
         
         return f"Searched {len(successful_agents)} agents ({', '.join(successful_agents)}) and found {total_results} total results for '{query}'"
 
+_PREVIEW_ENCODER = json.JSONEncoder(default=str)
+
+def _preview(item: Any, limit: int = 200) -> str:
+    """JSON-encode item only as far as the first limit characters"""
+    parts = []
+    size = 0
+    # iterencode yields fragments lazily, so large payloads are never fully serialized
+    for chunk in _PREVIEW_ENCODER.iterencode(item):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+@lru_cache(maxsize=1)
+def get_orchestrator() -> WorkingOrchestrator:
+    """Return the per-process orchestrator, built on first use"""
+    return WorkingOrchestrator()
+
 async def run_cli_query(query: str, max_results: int = 10):
     """Run a query from command line"""
-    orchestrator = WorkingOrchestrator()
+    orchestrator = get_orchestrator()
     
     print(f"\n🤖 Processing query: {query}")
     print("=" * 60)
     
     request = QueryRequest(prompt=query, max_results=max_results)
-    response = await orchestrator.process_query(request)
+    try:
+        response = await orchestrator.process_query(request)
+    finally:
+        await orchestrator.shutdown()
     
     print(f"\n📊 Summary: {response.summary}")
     print(f"⏱️  Execution time: {response.execution_time:.2f}s")
@@ -341,46 +564,59 @@ async def run_cli_query(query: str, max_results: int = 10):
         if result.success and result.data:
             print(f"\n📁 {result.agent_type.value} Agent Results:")
             for i, item in enumerate(result.data[:3], 1):  # Show first 3 results
-                print(f"  {i}. {json.dumps(item, indent=4, default=str)[:200]}...")
+                print(f"  {i}. {_preview(item)}...")
         elif not result.success:
             print(f"\n❌ {result.agent_type.value} Agent Error: {result.error}")
 
-def run_web_server(host: str = "0.0.0.0", port: int = 8000):
-    """Run the web server"""
-    try:
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import HTMLResponse
-        from fastapi.staticfiles import StaticFiles
-        from fastapi.middleware.cors import CORSMiddleware
-        from pydantic import BaseModel
-        import uvicorn
+# /preview reads at most PREVIEW_BYTES; a file whose first SNIFF_BYTES are
+# mostly control bytes is reported as binary without reading further
+PREVIEW_BYTES = 50000
+SNIFF_BYTES = 512
+_TEXT_BYTES = bytes(range(32, 127)) + bytes(range(128, 256)) + b"\t\n\r\f\b"
+# Formats whose headers are mostly printable, so the byte ratio alone would let them through
+_BINARY_MAGIC = (b"%PDF-", b"\x89PNG", b"PK\x03\x04", b"GIF8", b"\xff\xd8\xff", b"\x7fELF", b"\x1f\x8b")
 
-        class SearchRequest(BaseModel):
-            prompt: str
-            max_results: int = 10
-        
-        app = FastAPI(title="Agentic AI Workflows", version="1.0.0")
-        
-        # Add CORS middleware
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["http://localhost:4200", "http://127.0.0.1:4200"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-        
-        orchestrator = WorkingOrchestrator()
+@lru_cache(maxsize=1)
+def _allowed_roots() -> tuple:
+    """Canonical directories /preview may serve from: the search root and configured paths"""
+    roots = ["."] + [p for p in settings.filesystem_paths if p]
+    return tuple(dict.fromkeys(os.path.join(os.path.realpath(p), '') for p in roots))
+
+def _read_preview(real_path: str, file_path: str) -> Dict[str, Any]:
+    """Build the /preview payload for a regular file"""
+    with open(real_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(file_path)
         
-        # Serve static files
-        try:
-            app.mount("/static", StaticFiles(directory="static"), name="static")
-        except Exception:
-            pass  # Static directory might not exist
+        file_info = {
+            "name": os.path.basename(file_path),
+            "path": file_path,
+            "size": st.st_size,
+            "modified": st.st_mtime
+        }
         
-        @app.get("/", response_class=HTMLResponse)
-        async def home():
-            return """
+        head = f.read(SNIFF_BYTES)
+        # translate() deletes text bytes in C; what remains are control bytes
+        if head.startswith(_BINARY_MAGIC) or (head and len(head.translate(None, _TEXT_BYTES)) > len(head) * 0.3):
+            content = "[Binary file - cannot preview text content]"
+        else:
+            data = head + f.read(PREVIEW_BYTES - len(head))
+            content = data.decode('utf-8', errors='replace')
+            if len(data) == PREVIEW_BYTES:
+                content += "\n\n... (file truncated for preview)"
+    
+    return {
+        "file_info": file_info,
+        "content": content
+    }
+
+# /search responses are reused for identical (prompt, max_results) within the TTL
+SEARCH_CACHE_MAXSIZE = 512
+SEARCH_CACHE_TTL = 60.0
+
+# Landing page served by the web UI; built once at import time
+_HOME_HTML = """
             <!DOCTYPE html>
             <html lang="en">
             <head>
@@ -388,11 +624,110 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
                 <title>Agentic AI Workflows - Intelligent Information Assistant</title>
                 <link rel="stylesheet" href="/static/style.css">
+                <style>
+                    .example-query {
+                        padding: 12px 16px;
+                        background: rgba(102, 126, 234, 0.1);
+                        border: 1px solid rgba(102, 126, 234, 0.2);
+                        border-radius: 8px;
+                        color: #667eea;
+                        cursor: pointer;
+                        transition: all 0.3s ease;
+                        text-align: left;
+                        font-size: 0.95em;
+                    }
+                    
+                    .example-query:hover {
+                        background: #667eea;
+                        color: white;
+                        transform: translateY(-1px);
+                    }
+                    
+                    .meta-info {
+                        margin-top: 15px;
+                        display: flex;
+                        gap: 10px;
+                        justify-content: center;
+                        flex-wrap: wrap;
+                    }
+                    
+                    .loading-hint {
+                        margin-top: 10px;
+                        font-size: 0.9em;
+                        opacity: 0.7;
+                    }
+                    
+                    .examples {
+                        margin: 30px auto 0;
+                        text-align: left;
+                        max-width: 600px;
+                    }
+                    
+                    .examples h4 {
+                        margin-bottom: 15px;
+                        color: #333;
+                    }
+                    
+                    .example-list {
+                        display: grid;
+                        gap: 10px;
+                    }
+                    
+                    .result-actions {
+                        display: flex;
+                        gap: 10px;
+                        margin-top: 10px;
+                    }
+                    
+                    .more-results {
+                        text-align: center;
+                        margin-top: 15px;
+                        color: #666;
+                        font-style: italic;
+                    }
+                    
+                    .preview-pre {
+                        background: #f8f9fa;
+                        padding: 10px;
+                        border-radius: 5px;
+                        overflow-x: auto;
+                        font-size: 0.9em;
+                    }
+                    
+                    .error-box {
+                        color: #e53e3e;
+                        padding: 20px;
+                        text-align: center;
+                    }
+                </style>
             </head>
             <body>
+                <!-- Icon sprite: parsed once, referenced by <use> everywhere else -->
+                <svg xmlns="http://www.w3.org/2000/svg" style="display: none">
+                    <symbol id="icon-bot" viewBox="0 0 24 24"><rect x="3" y="11" width="18" height="10" rx="2"/><circle cx="12" cy="5" r="2"/><path d="M12 7v4M8 16h.01M16 16h.01"/></symbol>
+                    <symbol id="icon-search" viewBox="0 0 24 24"><circle cx="11" cy="11" r="8"/><path d="M21 21l-4.35-4.35"/></symbol>
+                    <symbol id="icon-clock" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M12 6v6l4 2"/></symbol>
+                    <symbol id="icon-chart" viewBox="0 0 24 24"><path d="M18 20V10M12 20V4M6 20v-6"/></symbol>
+                    <symbol id="icon-chat" viewBox="0 0 24 24"><path d="M21 15a2 2 0 0 1-2 2H7l-4 4V5a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2z"/></symbol>
+                    <symbol id="icon-bulb" viewBox="0 0 24 24"><path d="M9 18h6M10 22h4M12 2a7 7 0 0 0-4 12.7V17h8v-2.3A7 7 0 0 0 12 2z"/></symbol>
+                    <symbol id="icon-file" viewBox="0 0 24 24"><path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8z"/><path d="M14 2v6h6"/></symbol>
+                    <symbol id="icon-folder" viewBox="0 0 24 24"><path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2z"/></symbol>
+                    <symbol id="icon-api" viewBox="0 0 24 24"><path d="M10 13a5 5 0 0 0 7.54.54l3-3a5 5 0 0 0-7.07-7.07l-1.72 1.71"/><path d="M14 11a5 5 0 0 0-7.54-.54l-3 3a5 5 0 0 0 7.07 7.07l1.71-1.71"/></symbol>
+                    <symbol id="icon-url" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></symbol>
+                    <symbol id="icon-ticket" viewBox="0 0 24 24"><path d="M3 7a2 2 0 0 1 2-2h14a2 2 0 0 1 2 2v3a2 2 0 0 0 0 4v3a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-3a2 2 0 0 0 0-4z"/></symbol>
+                    <symbol id="icon-code" viewBox="0 0 24 24"><path d="M16 18l6-6-6-6M8 6l-6 6 6 6"/></symbol>
+                    <symbol id="icon-video" viewBox="0 0 24 24"><rect x="2" y="5" width="15" height="14" rx="2"/><path d="M23 7l-6 5 6 5z"/></symbol>
+                    <symbol id="icon-cloud" viewBox="0 0 24 24"><path d="M18 10h-1.26A8 8 0 1 0 9 20h9a5 5 0 0 0 0-10z"/></symbol>
+                    <symbol id="icon-list" viewBox="0 0 24 24"><path d="M8 6h13M8 12h13M8 18h13M3 6h.01M3 12h.01M3 18h.01"/></symbol>
+                    <symbol id="icon-preview" viewBox="0 0 24 24"><path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"/><circle cx="12" cy="12" r="3"/></symbol>
+                    <symbol id="icon-copy" viewBox="0 0 24 24"><rect x="9" y="9" width="13" height="13" rx="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></symbol>
+                    <symbol id="icon-check" viewBox="0 0 24 24"><path d="M20 6L9 17l-5-5"/></symbol>
+                    <symbol id="icon-error" viewBox="0 0 24 24"><circle cx="12" cy="12" r="10"/><path d="M15 9l-6 6M9 9l6 6"/></symbol>
+                </svg>
+                
                 <div class="container">
                     <div class="header">
-                        <h1>🤖 Agentic AI Workflows</h1>
+                        <h1><svg class="icon"><use href="#icon-bot"/></svg> Agentic AI Workflows</h1>
                         <p>Your intelligent assistant for finding information across multiple sources</p>
                         <div class="meta-info">
                             <span class="badge">Multi-Agent System</span>
@@ -406,13 +741,13 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                             <input type="text" id="queryInput" class="search-input" 
                                    placeholder="Ask me anything... (e.g., 'Find Python files in this project', 'Get data from GitHub API')" />
                             <button onclick="search()" class="search-button" id="searchBtn">
-                                <span id="searchText">🔍 Search</span>
+                                <svg class="icon"><use href="#icon-search"/></svg> <span id="searchText">Search</span>
                             </button>
                         </div>
                         
                         <div class="loading" id="loading">
-                            <div>🔍 Searching across multiple sources...</div>
-                            <div style="margin-top: 10px; font-size: 0.9em; opacity: 0.7;">This may take a few seconds</div>
+                            <div><svg class="icon"><use href="#icon-search"/></svg> Searching across multiple sources...</div>
+                            <div class="loading-hint">This may take a few seconds</div>
                         </div>
                     </div>
                     
@@ -421,13 +756,13 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                     </div>
                     
                     <div class="empty-state" id="emptyState">
-                        <h3>👋 Welcome to Agentic AI Workflows</h3>
+                        <h3><svg class="icon"><use href="#icon-bot"/></svg> Welcome to Agentic AI Workflows</h3>
                         <p>Ask me to search for files, fetch data from APIs, or find information from various sources.<br>
                         I'll provide you with natural language answers and clickable links to explore further.</p>
                         
-                        <div style="margin-top: 30px; text-align: left; max-width: 600px; margin-left: auto; margin-right: auto;">
-                            <h4 style="margin-bottom: 15px; color: #333;">💡 Try these examples:</h4>
-                            <div style="display: grid; gap: 10px;">
+                        <div class="examples">
+                            <h4><svg class="icon"><use href="#icon-bulb"/></svg> Try these examples:</h4>
+                            <div class="example-list">
                                 <button onclick="setQuery('Find all Python files in this project')" class="example-query">Find all Python files in this project</button>
                                 <button onclick="setQuery('Get information from GitHub API')" class="example-query">Get information from GitHub API</button>
                                 <button onclick="setQuery('Search for configuration files')" class="example-query">Search for configuration files</button>
@@ -452,34 +787,6 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                     </div>
                 </div>
                 
-                <style>
-                    .example-query {
-                        padding: 12px 16px;
-                        background: rgba(102, 126, 234, 0.1);
-                        border: 1px solid rgba(102, 126, 234, 0.2);
-                        border-radius: 8px;
-                        color: #667eea;
-                        cursor: pointer;
-                        transition: all 0.3s ease;
-                        text-align: left;
-                        font-size: 0.95em;
-                    }
-                    
-                    .example-query:hover {
-                        background: #667eea;
-                        color: white;
-                        transform: translateY(-1px);
-                    }
-                    
-                    .meta-info {
-                        margin-top: 15px;
-                        display: flex;
-                        gap: 10px;
-                        justify-content: center;
-                        flex-wrap: wrap;
-                    }
-                </style>
-                
                 <script>
                     function setQuery(query) {
                         document.getElementById('queryInput').value = query;
@@ -495,7 +802,7 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                         document.getElementById('emptyState').style.display = 'none';
                         document.getElementById('resultsSection').style.display = 'none';
                         document.getElementById('searchBtn').disabled = true;
-                        document.getElementById('searchText').innerHTML = '⏳ Searching...';
+                        document.getElementById('searchText').textContent = 'Searching...';
                         
                         try {
                             const response = await fetch('/search', {
@@ -517,72 +824,125 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                             // Hide loading state
                             document.getElementById('loading').classList.remove('show');
                             document.getElementById('searchBtn').disabled = false;
-                            document.getElementById('searchText').innerHTML = '🔍 Search';
+                            document.getElementById('searchText').textContent = 'Search';
+                        }
+                    }
+                    
+                    // Build a DOM node without the HTML parser; strings become text nodes
+                    function el(tag, attrs, ...children) {
+                        const node = document.createElement(tag);
+                        for (const key in attrs) node.setAttribute(key, attrs[key]);
+                        for (const child of children.flat()) {
+                            if (child !== null && child !== undefined && child !== '') node.append(child);
                         }
+                        return node;
+                    }
+                    
+                    // Icons are <use> references into the sprite at the top of <body>
+                    const SVG_NS = 'http://www.w3.org/2000/svg';
+                    
+                    function icon(name) {
+                        const svg = document.createElementNS(SVG_NS, 'svg');
+                        const use = document.createElementNS(SVG_NS, 'use');
+                        svg.setAttribute('class', 'icon');
+                        svg.setAttribute('aria-hidden', 'true');
+                        use.setAttribute('href', `#icon-${name}`);
+                        svg.append(use);
+                        return svg;
                     }
                     
+                    const AGENT_ICONS = {
+                        'filesystem': 'folder',
+                        'api': 'api',
+                        'url': 'url',
+                        'jira': 'ticket',
+                        'github': 'code',
+                        'video': 'video',
+                        's3': 'cloud'
+                    };
+                    
+                    // Result items are appended in batches; a newer search abandons pending batches
+                    const RENDER_BATCH = 50;
+                    let renderToken = 0;
+                    
                     function displayResults(data) {
                         console.log('Displaying results:', data);
                         document.getElementById('resultsSection').style.display = 'block';
                         
-                        let html = `
-                            <div class="results-header">
-                                <div class="results-title">Results for: "${data.query}"</div>
-                                <div class="results-meta">
-                                    <div class="meta-item">
-                                        <span>⏱️</span>
-                                        <span>${data.execution_time.toFixed(2)}s</span>
-                                    </div>
-                                    <div class="meta-item">
-                                        <span>📊</span>
-                                        <span>${data.total_results} results</span>
-                                    </div>
-                                    <div class="meta-item">
-                                        <span>🤖</span>
-                                        <span>${data.agents_used ? data.agents_used.length : 0} agents</span>
-                                    </div>
-                                </div>
-                            </div>
-                        `;
+                        const container = document.getElementById('results');
+                        const token = ++renderToken;
+                        const frag = document.createDocumentFragment();
+                        const pending = [];  // [parent, build] pairs, appended in order
                         
-                        // Add natural language answer
-                        html += `
-                            <div class="answer-section">
-                                <div class="answer-title">
-                                    <span>💬</span>
-                                    <span>Answer</span>
-                                </div>
-                                <div class="answer-content">
-                                    ${formatAnswer(data)}
-                                </div>
-                            </div>
-                        `;
+                        frag.append(renderHeader(data), renderAnswer(data));
                         
                         // Add detailed results
-                        if (data.results && data.results.length > 0) {
-                            data.results.forEach(result => {
+                        (data.results || []).forEach(result => {
                             if (result.success && result.data.length > 0) {
-                                html += formatAgentResults(result);
+                                const [section, content] = renderAgentSection(result);
+                                const agentType = result.agent_type.toLowerCase();
+                                result.data.slice(0, 5).forEach((item, index) => {
+                                    pending.push([content, () => renderResultItem(item, agentType, index)]);
+                                });
+                                if (result.data.length > 5) {
+                                    pending.push([content, () => el('div', {class: 'more-results'},
+                                        `... and ${result.data.length - 5} more results`)]);
+                                }
+                                frag.append(section);
                             } else if (!result.success) {
-                                html += `
-                                    <div class="agent-results">
-                                        <div class="agent-header">
-                                            <div class="agent-title">
-                                                <span>❌</span>
-                                                <span>${result.agent_type} Agent</span>
-                                            </div>
-                                            <div class="agent-meta">Error occurred</div>
-                                        </div>
-                                        <div class="agent-content">
-                                            <div class="error-message">${result.error}</div>
-                                        </div>
-                                    </div>
-                                `;
+                                frag.append(renderAgentError(result));
                             }
                         });
+                        
+                        // The first batch goes in with the fragment: one replaceChildren, one layout
+                        let next = appendBatch(pending, 0);
+                        requestAnimationFrame(() => {
+                            if (token !== renderToken) return;
+                            container.replaceChildren(frag);
+                            const step = () => {
+                                if (token !== renderToken || next >= pending.length) return;
+                                next = appendBatch(pending, next);
+                                setTimeout(step, 0);
+                            };
+                            setTimeout(step, 0);
+                        });
+                    }
+                    
+                    function appendBatch(pending, start) {
+                        const end = Math.min(start + RENDER_BATCH, pending.length);
+                        for (let i = start; i < end; i++) {
+                            const [parent, build] = pending[i];
+                            parent.append(build());
                         }
+                        return end;
+                    }
+                    
+                    function metaItem(name, text) {
+                        return el('div', {class: 'meta-item'}, icon(name), el('span', null, text));
+                    }
+                    
+                    function renderHeader(data) {
+                        return el('div', {class: 'results-header'},
+                            el('div', {class: 'results-title'}, `Results for: "${data.query}"`),
+                            el('div', {class: 'results-meta'},
+                                metaItem('clock', `${data.execution_time.toFixed(2)}s`),
+                                metaItem('chart', `${data.total_results} results`),
+                                metaItem('bot', `${data.agents_used ? data.agents_used.length : 0} agents`)
+                            )
+                        );
+                    }
+                    
+                    function renderAnswer(data) {
+                        const content = el('div', {class: 'answer-content'});
+                        formatAnswer(data).forEach((line, i) => {
+                            if (i) content.append(el('br'));
+                            content.append(...[line].flat());
+                        });
                         
-                        document.getElementById('results').innerHTML = html;
+                        return el('div', {class: 'answer-section'},
+                            el('div', {class: 'answer-title'}, icon('chat'), el('span', null, 'Answer')),
+                            content
+                        );
                     }
                     
                     function formatAnswer(data) {
@@ -590,171 +950,147 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                         const agents = data.agents_used.map(agent => agent.toLowerCase()).join(', ');
                         const query = data.query;
                         
-                        let answer = `I found ${totalResults} results for your query "${query}" by searching through ${agents} sources. `;
+                        const intro = `I found ${totalResults} results for your query "${query}" by searching through ${agents} sources. `;
                         
                         // Add specific insights based on results
                         const successfulResults = data.results ? data.results.filter(r => r.success && r.data && r.data.length > 0) : [];
                         
-                        if (successfulResults.length > 0) {
-                            answer += "Here's what I discovered:\n\n";
-                            
-                            successfulResults.forEach(result => {
-                                const count = result.data.length;
-                                const agentType = result.agent_type.toLowerCase();
-                                
-                                if (agentType === 'filesystem') {
-                                    answer += `📁 Found ${count} files on your local system that match your criteria.\n`;
-                                } else if (agentType === 'api') {
-                                    answer += `🔗 Retrieved data from ${count} API endpoints.\n`;
-                                } else if (agentType === 'url') {
-                                    answer += `🌐 Fetched content from ${count} web sources.\n`;
-                                }
-                            });
-                            
-                            answer += "\nClick on the links below to explore the detailed results and access the actual content.";
-                        } else {
-                            answer += "Unfortunately, I couldn't find any matching results. Try refining your search terms or checking if the sources are accessible.";
+                        if (successfulResults.length === 0) {
+                            return [intro + "Unfortunately, I couldn't find any matching results. Try refining your search terms or checking if the sources are accessible."];
                         }
                         
-                        return answer.replace(/\n/g, '<br>');
-                    }
-                    
-                    function formatAgentResults(result) {
-                        const agentIcons = {
-                            'filesystem': '📁',
-                            'api': '🔗',
-                            'url': '🌐',
-                            'jira': '🎫',
-                            'github': '🐙',
-                            'video': '🎥',
-                            's3': '☁️'
-                        };
-                        
-                        const icon = agentIcons[result.agent_type.toLowerCase()] || '🤖';
-                        
-                        let html = `
-                            <div class="agent-results">
-                                <div class="agent-header">
-                                    <div class="agent-title">
-                                        <span>${icon}</span>
-                                        <span>${result.agent_type} Agent</span>
-                                    </div>
-                                    <div class="agent-meta">${result.data.length} results found</div>
-                                </div>
-                                <div class="agent-content">
-                        `;
-                        
-                        result.data.slice(0, 5).forEach((item, index) => {
-                            html += formatResultItem(item, result.agent_type.toLowerCase(), index);
+                        const lines = [intro + "Here's what I discovered:", ''];
+                        successfulResults.forEach(result => {
+                            const count = result.data.length;
+                            const agentType = result.agent_type.toLowerCase();
+                            
+                            if (agentType === 'filesystem') {
+                                lines.push([icon('folder'), ` Found ${count} files on your local system that match your criteria.`]);
+                            } else if (agentType === 'api') {
+                                lines.push([icon('api'), ` Retrieved data from ${count} API endpoints.`]);
+                            } else if (agentType === 'url') {
+                                lines.push([icon('url'), ` Fetched content from ${count} web sources.`]);
+                            }
                         });
+                        lines.push('', 'Click on the links below to explore the detailed results and access the actual content.');
                         
-                        if (result.data.length > 5) {
-                            html += `<div style="text-align: center; margin-top: 15px; color: #666; font-style: italic;">... and ${result.data.length - 5} more results</div>`;
-                        }
-                        
-                        html += `
-                                </div>
-                            </div>
-                        `;
-                        
-                        return html;
+                        return lines;
                     }
                     
-                    function formatResultItem(item, agentType, index) {
-                        let html = '<div class="result-item">';
+                    function renderAgentSection(result) {
+                        const name = AGENT_ICONS[result.agent_type.toLowerCase()] || 'bot';
+                        const content = el('div', {class: 'agent-content'});
+                        const section = el('div', {class: 'agent-results'},
+                            el('div', {class: 'agent-header'},
+                                el('div', {class: 'agent-title'}, icon(name), el('span', null, `${result.agent_type} Agent`)),
+                                el('div', {class: 'agent-meta'}, `${result.data.length} results found`)
+                            ),
+                            content
+                        );
+                        return [section, content];
+                    }
+                    
+                    function renderAgentError(result) {
+                        return el('div', {class: 'agent-results'},
+                            el('div', {class: 'agent-header'},
+                                el('div', {class: 'agent-title'}, icon('error'), el('span', null, `${result.agent_type} Agent`)),
+                                el('div', {class: 'agent-meta'}, 'Error occurred')
+                            ),
+                            el('div', {class: 'agent-content'},
+                                el('div', {class: 'error-message'}, result.error)
+                            )
+                        );
+                    }
+                    
+                    function resultTitle(name, text) {
+                        return el('div', {class: 'result-title'}, icon(name), el('span', null, text));
+                    }
+                    
+                    function field(label, value) {
+                        return [el('strong', null, `${label}:`), ` ${value}`, el('br')];
+                    }
+                    
+                    function resultLink(href, name, text) {
+                        return el('a', {href: href, class: 'result-link', target: '_blank'}, icon(name), el('span', null, text));
+                    }
+                    
+                    function renderResultItem(item, agentType, index) {
+                        const node = el('div', {class: 'result-item'});
                         
                         if (agentType === 'filesystem') {
-                            html += `
-                                <div class="result-title">
-                                    <span>📄</span>
-                                    <span>${item.file_name || item.name || 'Unknown File'}</span>
-                                </div>
-                                <div class="result-content">
-                                    <strong>Path:</strong> ${item.file_path || item.path || 'Unknown'}<br>
-                                    <strong>Size:</strong> ${formatFileSize(item.size || 0)}<br>
-                                    <strong>Match:</strong> ${item.match_type || item.type || 'Content match'}<br>
-                                    ${item.preview ? `<strong>Preview:</strong> ${item.preview.substring(0, 150)}...` : ''}
-                                </div>
-                                <div style="display: flex; gap: 10px; margin-top: 10px;">
-                                    <button onclick="previewFile('${item.file_path || item.path}')" class="result-link">
-                                        <span>👁️</span>
-                                        <span>Preview</span>
-                                    </button>
-                                    <a href="file://${item.file_path || item.path}" class="result-link" target="_blank">
-                                        <span>📂</span>
-                                        <span>Open File</span>
-                                    </a>
-                                </div>
-                            `;
+                            const path = item.file_path || item.path;
+                            const previewBtn = el('button', {class: 'result-link'}, icon('preview'), el('span', null, 'Preview'));
+                            previewBtn.addEventListener('click', () => previewFile(path));
+                            node.append(
+                                resultTitle('file', item.file_name || item.name || 'Unknown File'),
+                                el('div', {class: 'result-content'},
+                                    field('Path', item.file_path || item.path || 'Unknown'),
+                                    field('Size', formatFileSize(item.size || 0)),
+                                    field('Match', item.match_type || item.type || 'Content match'),
+                                    item.preview ? [el('strong', null, 'Preview:'), ` ${item.preview.substring(0, 150)}...`] : ''
+                                ),
+                                el('div', {class: 'result-actions'},
+                                    previewBtn,
+                                    resultLink(`file://${path}`, 'folder', 'Open File')
+                                )
+                            );
                         } else if (agentType === 'api') {
-                            html += `
-                                <div class="result-title">
-                                    <span>🔗</span>
-                                    <span>API Response ${index + 1}</span>
-                                </div>
-                                <div class="result-content">
-                                    <strong>Endpoint:</strong> ${item.api_url}<br>
-                                    <strong>Status:</strong> ${item.status_code || item.status}<br>
-                                    ${item.query_relevance !== undefined ? `<strong>Relevance:</strong> ${item.query_relevance ? 'High' : 'Low'}<br>` : ''}
-                                    ${item.error ? `<strong>Error:</strong> ${item.error}` : ''}
-                                </div>
-                                <a href="${item.api_url}" class="result-link" target="_blank">
-                                    <span>🌐</span>
-                                    <span>View API</span>
-                                </a>
-                            `;
+                            node.append(
+                                resultTitle('api', `API Response ${index + 1}`),
+                                el('div', {class: 'result-content'},
+                                    field('Endpoint', item.api_url),
+                                    field('Status', item.status_code || item.status),
+                                    item.query_relevance !== undefined ? field('Relevance', item.query_relevance ? 'High' : 'Low') : '',
+                                    item.error ? [el('strong', null, 'Error:'), ` ${item.error}`] : ''
+                                ),
+                                resultLink(item.api_url, 'url', 'View API')
+                            );
                         } else if (agentType === 'url') {
-                            html += `
-                                <div class="result-title">
-                                    <span>🌐</span>
-                                    <span>${item.title || 'Web Content'}</span>
-                                </div>
-                                <div class="result-content">
-                                    <strong>URL:</strong> ${item.url}<br>
-                                    <strong>Status:</strong> ${item.status_code || item.status}<br>
-                                    <strong>Content Type:</strong> ${item.content_type || 'Unknown'}<br>
-                                    ${item.content_preview ? `<strong>Preview:</strong> ${item.content_preview.substring(0, 150)}...` : ''}
-                                    ${item.error ? `<strong>Error:</strong> ${item.error}` : ''}
-                                </div>
-                                <a href="${item.url}" class="result-link" target="_blank">
-                                    <span>🔗</span>
-                                    <span>Visit Site</span>
-                                </a>
-                            `;
+                            node.append(
+                                resultTitle('url', item.title || 'Web Content'),
+                                el('div', {class: 'result-content'},
+                                    field('URL', item.url),
+                                    field('Status', item.status_code || item.status),
+                                    field('Content Type', item.content_type || 'Unknown'),
+                                    item.content_preview ? [el('strong', null, 'Preview:'), ` ${item.content_preview.substring(0, 150)}...`] : '',
+                                    item.error ? [el('strong', null, 'Error:'), ` ${item.error}`] : ''
+                                ),
+                                resultLink(item.url, 'api', 'Visit Site')
+                            );
                         } else {
                             // Generic format for other agent types
-                            html += `
-                                <div class="result-title">
-                                    <span>📋</span>
-                                    <span>Result ${index + 1}</span>
-                                </div>
-                                <div class="result-content">
-                                    <pre style="background: #f8f9fa; padding: 10px; border-radius: 5px; overflow-x: auto; font-size: 0.9em;">${JSON.stringify(item, null, 2)}</pre>
-                                </div>
-                            `;
+                            node.append(
+                                resultTitle('list', `Result ${index + 1}`),
+                                el('div', {class: 'result-content'},
+                                    el('pre', {class: 'preview-pre'}, JSON.stringify(item, null, 2))
+                                )
+                            );
                         }
                         
-                        html += '</div>';
-                        return html;
+                        return node;
                     }
                     
+                    const SIZE_UNITS = ['Bytes', 'KB', 'MB', 'GB', 'TB'];
+                    
                     function formatFileSize(bytes) {
-                        if (bytes === 0) return '0 Bytes';
-                        const k = 1024;
-                        const sizes = ['Bytes', 'KB', 'MB', 'GB'];
-                        const i = Math.floor(Math.log(bytes) / Math.log(k));
-                        return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
+                        if (!bytes) return '0 Bytes';
+                        // Unit index from the bit length; Math.log only past 32 bits
+                        const i = bytes < 4294967296
+                            ? (31 - Math.clz32(bytes)) / 10 | 0
+                            : Math.min(4, Math.floor(Math.log2(bytes) / 10));
+                        return parseFloat((bytes / 2 ** (i * 10)).toFixed(2)) + ' ' + SIZE_UNITS[i];
                     }
                     
                     function displayError(message) {
+                        renderToken++;  // Drop any result batches still pending
                         document.getElementById('resultsSection').style.display = 'block';
-                        document.getElementById('results').innerHTML = `
-                            <div class="error-message">
-                                <h3>❌ Search Error</h3>
-                                <p>${message}</p>
-                                <p>Please try again or contact support if the problem persists.</p>
-                            </div>
-                        `;
+                        document.getElementById('results').replaceChildren(
+                            el('div', {class: 'error-message'},
+                                el('h3', null, icon('error'), ' Search Error'),
+                                el('p', null, message),
+                                el('p', null, 'Please try again or contact support if the problem persists.')
+                            )
+                        );
                     }
                     
                     // Allow Enter key to trigger search
@@ -779,12 +1115,16 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                             // Show modal
                             modal.style.display = 'block';
                             modalTitle.textContent = 'Loading...';
-                            fileInfo.innerHTML = '';
+                            fileInfo.replaceChildren();
                             fileContent.textContent = 'Loading file preview...';
-                            previewActions.innerHTML = '';
+                            previewActions.replaceChildren();
                             
                             // Fetch file preview
-                            const response = await fetch(`/preview/${encodeURIComponent(filePath)}`);
+                            const response = await fetch('/preview', {
+                                method: 'POST',
+                                headers: {'content-type': 'application/json'},
+                                body: JSON.stringify({path: filePath})
+                            });
                             
                             if (!response.ok) {
                                 throw new Error(`HTTP ${response.status}: ${response.statusText}`);
@@ -795,64 +1135,55 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
                             // Update modal content
                             modalTitle.textContent = data.file_info.name;
                             
-                            // File info
-                            fileInfo.innerHTML = `
-                                <div class="info-item">
-                                    <div class="info-label">File Name</div>
-                                    <div class="info-value">${data.file_info.name}</div>
-                                </div>
-                                <div class="info-item">
-                                    <div class="info-label">File Path</div>
-                                    <div class="info-value">${data.file_info.path}</div>
-                                </div>
-                                <div class="info-item">
-                                    <div class="info-label">File Size</div>
-                                    <div class="info-value">${formatFileSize(data.file_info.size)}</div>
-                                </div>
-                                <div class="info-item">
-                                    <div class="info-label">Last Modified</div>
-                                    <div class="info-value">${new Date(data.file_info.modified * 1000).toLocaleString()}</div>
-                                </div>
-                            `;
+                            // File info; name and path are file-controlled, so they only ever become text
+                            fileInfo.replaceChildren(
+                                infoItem('File Name', data.file_info.name),
+                                infoItem('File Path', data.file_info.path),
+                                infoItem('File Size', formatFileSize(data.file_info.size)),
+                                infoItem('Last Modified', new Date(data.file_info.modified * 1000).toLocaleString())
+                            );
                             
                             // Preview actions
-                            previewActions.innerHTML = `
-                                <a href="file://${data.file_info.path}" class="action-btn" target="_blank">
-                                    <span>📂</span>
-                                    <span>Open in System</span>
-                                </a>
-                                <button onclick="copyToClipboard('${data.file_info.path}')" class="action-btn secondary">
-                                    <span>📋</span>
-                                    <span>Copy Path</span>
-                                </button>
-                            `;
+                            const copyBtn = el('button', {class: 'action-btn secondary'}, icon('copy'), el('span', null, 'Copy Path'));
+                            copyBtn.addEventListener('click', () => copyToClipboard(data.file_info.path, copyBtn));
+                            previewActions.replaceChildren(
+                                el('a', {href: `file://${data.file_info.path}`, class: 'action-btn', target: '_blank'},
+                                    icon('folder'), el('span', null, 'Open in System')),
+                                copyBtn
+                            );
                             
                             // File content
                             fileContent.textContent = data.content;
                             
                         } catch (error) {
                             console.error('File preview error:', error);
-                            document.getElementById('fileContent').innerHTML = `
-                                <div style="color: #e53e3e; padding: 20px; text-align: center;">
-                                    <h3>❌ Error Loading File</h3>
-                                    <p>${error.message}</p>
-                                </div>
-                            `;
+                            document.getElementById('fileContent').replaceChildren(
+                                el('div', {class: 'error-box'},
+                                    el('h3', null, icon('error'), ' Error Loading File'),
+                                    el('p', null, error.message)
+                                )
+                            );
                         }
                     }
                     
+                    function infoItem(label, value) {
+                        return el('div', {class: 'info-item'},
+                            el('div', {class: 'info-label'}, label),
+                            el('div', {class: 'info-value'}, value)
+                        );
+                    }
+                    
                     function closeModal() {
                         document.getElementById('fileModal').style.display = 'none';
                     }
                     
-                    function copyToClipboard(text) {
+                    function copyToClipboard(text, btn) {
                         navigator.clipboard.writeText(text).then(() => {
                             // Show temporary feedback
-                            const btn = event.target.closest('button');
-                            const originalText = btn.innerHTML;
-                            btn.innerHTML = '<span>✓</span><span>Copied!</span>';
+                            const original = [...btn.childNodes];
+                            btn.replaceChildren(icon('check'), el('span', null, 'Copied!'));
                             setTimeout(() => {
-                                btn.innerHTML = originalText;
+                                btn.replaceChildren(...original);
                             }, 2000);
                         }).catch(err => {
                             console.error('Failed to copy:', err);
@@ -870,68 +1201,240 @@ def run_web_server(host: str = "0.0.0.0", port: int = 8000):
             </body>
             </html>
             """
+# Encoded once so responses hand the same bytes object to the server
+_HOME_BODY = _HOME_HTML.encode("utf-8")
+_HOME_ETAG = f'"{hashlib.md5(_HOME_BODY).hexdigest()}"'
+_HOME_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _HOME_ETAG, "Vary": "Accept-Encoding"}
+
+# Compressed once at import at the highest level; brotli only when the package is installed
+try:
+    import brotli
+    _HOME_BR = brotli.compress(_HOME_BODY, quality=11)
+except ImportError:
+    _HOME_BR = None
+_HOME_GZIP = gzip.compress(_HOME_BODY, compresslevel=9)
+
+def _accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Whether an Accept-Encoding header allows coding; q=0 refuses it, '*' covers unlisted codings"""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        token, _, params = item.partition(";")
+        token = token.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if token == coding:
+            return q > 0
+        if token == "*":
+            wildcard = q > 0
+    return wildcard
+
+def create_app():
+    """Build the FastAPI app; each server worker process calls this once"""
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
+    from fastapi.staticfiles import StaticFiles
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
+    from starlette.datastructures import Headers
+    from pydantic import BaseModel
+    from contextlib import asynccontextmanager
+
+    class SearchRequest(BaseModel):
+        prompt: str
+        max_results: int = 10
+    
+    class PreviewRequest(BaseModel):
+        path: str
+    
+    class QValueGZipMiddleware(GZipMiddleware):
+        """GZipMiddleware that respects gzip;q=0 instead of matching the substring"""
+        async def __call__(self, scope, receive, send):
+            if scope["type"] == "http":
+                accept = Headers(scope=scope).get("accept-encoding", "")
+                if not _accepts_encoding(accept, "gzip"):
+                    await self.app(scope, receive, send)
+                    return
+            await super().__call__(scope, receive, send)
+    
+    orchestrator = get_orchestrator()
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        await orchestrator.startup()
+        app.state.http = orchestrator.session
+        await orchestrator.warmup()
+        yield
+        await orchestrator.shutdown()
+    
+    # Handlers wrap plain dicts in this directly, skipping FastAPI's jsonable_encoder pass
+    response_class = ORJSONResponse if orjson is not None else JSONResponse
+    
+    app = FastAPI(
+        title="Agentic AI Workflows",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=response_class
+    )
+    
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:4200", "http://127.0.0.1:4200"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # /search and /preview JSON compresses well; pre-encoded responses (the home page) pass through
+    app.add_middleware(QValueGZipMiddleware, minimum_size=1024, compresslevel=6)
+    
+    # Serve static files
+    try:
+        app.mount("/static", StaticFiles(directory="static"), name="static")
+    except Exception:
+        pass  # Static directory might not exist
+    
+    @app.get("/", response_class=HTMLResponse)
+    async def home(request: Request):
+        # The page is static: serve the prebuilt body and let browsers revalidate by ETag
+        if request.headers.get("if-none-match") == _HOME_ETAG:
+            return Response(status_code=304, headers=_HOME_HEADERS)
         
-        @app.post("/search")
-        async def search_endpoint(request: SearchRequest):
-            """Search endpoint that processes queries through agents"""
-            try:
-                # Create QueryRequest object
-                query_request = QueryRequest(
+        # Every variant carries Vary: Accept-Encoding so caches key on the header
+        accept = request.headers.get("accept-encoding", "")
+        if _HOME_BR is not None and _accepts_encoding(accept, "br"):
+            return HTMLResponse(content=_HOME_BR, headers={**_HOME_HEADERS, "Content-Encoding": "br"})
+        if _accepts_encoding(accept, "gzip"):
+            return HTMLResponse(content=_HOME_GZIP, headers={**_HOME_HEADERS, "Content-Encoding": "gzip"})
+        return HTMLResponse(content=_HOME_BODY, headers=_HOME_HEADERS)
+    
+    # Recent /search responses, and the queries currently running for each key
+    search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    inflight: Dict[tuple, asyncio.Future] = {}
+    
+    def store_search(key: tuple, future: asyncio.Future):
+        inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if result.agents_used:  # Don't keep failed queries
+            search_cache[key] = (time.monotonic(), result.model_dump())
+            if len(search_cache) > SEARCH_CACHE_MAXSIZE:
+                search_cache.popitem(last=False)
+    
+    @app.post("/search")
+    async def search_endpoint(request: SearchRequest):
+        """Search endpoint that processes queries through agents"""
+        try:
+            # Keyed on the prompt exactly as sent: URL prompts are fetched verbatim and paths are case-sensitive
+            key = (request.prompt, request.max_results)
+            hit = search_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < SEARCH_CACHE_TTL:
+                search_cache.move_to_end(key)
+                return response_class(hit[1])
+            
+            # Identical concurrent requests await the same query
+            future = inflight.get(key)
+            if future is None:
+                # SearchRequest has already validated both fields
+                query_request = QueryRequest.model_construct(
                     prompt=request.prompt,
                     max_results=request.max_results
                 )
-                result = await orchestrator.process_query(query_request)
-                return result
-            except Exception as e:
-                logger.error(f"Search error: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @app.get("/preview/{file_path:path}")
-        async def preview_file(file_path: str):
-            """Preview file content"""
-            try:
-                import os
+                future = asyncio.ensure_future(orchestrator.process_query(query_request))
+                inflight[key] = future
+                future.add_done_callback(lambda f: store_search(key, f))
+            # A disconnecting client must not cancel work other requests share
+            result = await asyncio.shield(future)
+            return response_class(result.model_dump())
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    @app.post("/search/cache/clear")
+    async def clear_search_cache():
+        """Drop cached search responses, e.g. after sources change"""
+        cleared = len(search_cache)
+        search_cache.clear()
+        return {"cleared": cleared}
+    
+    @app.post("/preview")
+    async def preview_file(request: PreviewRequest):
+        """Preview file content"""
+        file_path = request.path
+        try:
+            # Resolve symlinks and '..' on every request; a cached answer could be stale
+            # after a symlink is swapped. Anything outside the allowed roots doesn't exist
+            real_path = os.path.realpath(file_path)
+            if not real_path.startswith(_allowed_roots()):
+                raise FileNotFoundError(file_path)
+            
+            # Stat, sniff and read happen on a worker thread, off the event loop
+            return response_class(await asyncio.to_thread(_read_preview, real_path, file_path))
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise HTTPException(status_code=404, detail="File not found")
+        except Exception as e:
+            logger.error("File preview error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    health_body = {"status": "healthy", "agents": orchestrator.agent_keys}
+    
+    @app.get("/health")
+    async def health_check():
+        return response_class(health_body)
+    
+    return app
 
-                
-                # Security check - ensure file exists and is readable
-                if not os.path.exists(file_path) or not os.path.isfile(file_path):
-                    raise HTTPException(status_code=404, detail="File not found")
-                
-                file_info = {
-                    "name": os.path.basename(file_path),
-                    "path": file_path,
-                    "size": os.path.getsize(file_path),
-                    "modified": os.path.getmtime(file_path)
-                }
-                
-                # Try to read file content (limit to 50KB for preview)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read(50000)  # Limit to 50KB
-                        if len(content) == 50000:
-                            content += "\n\n... (file truncated for preview)"
-                except UnicodeDecodeError:
-                    content = "[Binary file - cannot preview text content]"
-                except Exception as e:
-                    content = f"[Error reading file: {str(e)}]"
-                
-                return {
-                    "file_info": file_info,
-                    "content": content
-                }
-            except Exception as e:
-                logger.error(f"File preview error: {str(e)}")
-                raise HTTPException(status_code=500, detail=str(e))
+# uvicorn's loggers hand records to the root handler instead of formatting them a second time
+UVICORN_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "loggers": {
+        "uvicorn": {"handlers": [], "propagate": True},
+        "uvicorn.error": {"handlers": [], "propagate": True},
+        "uvicorn.access": {"handlers": [], "propagate": True},
+    },
+}
+
+def run_web_server(host: str = "0.0.0.0", port: int = 8000, workers: int = None):
+    """Run the web server"""
+    try:
+        import uvicorn
         
-        @app.get("/health")
-        async def health_check():
-            return {"status": "healthy", "agents": list(orchestrator.agents.keys())}
+        workers = settings.app_workers if workers is None else workers
+        workers = workers or os.cpu_count() or 1
         
-        print(f"🚀 Starting Agentic AI Workflows Web Server...")
-        print(f"Server will be available at: http://localhost:{port}")
-        print("Press Ctrl+C to stop")
+        # Prefer uvloop + httptools when installed; fall back to uvicorn's pure-Python defaults
+        try:
+            import uvloop  # noqa: F401
+            import httptools  # noqa: F401
+            loop_options = {"loop": "uvloop", "http": "httptools"}
+        except ImportError:
+            loop_options = {}
+        
+        # Workers import the app factory by name and each builds its own orchestrator
+        app = "main_working:create_app" if workers > 1 else create_app()
         
-        uvicorn.run(app, host=host, port=port)
+        logger.info("Starting Agentic AI Workflows web server on http://localhost:%d with %d worker(s)", port, workers)
+        
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            workers=workers,
+            factory=workers > 1,
+            log_level=settings.log_level.lower(),
+            log_config=UVICORN_LOG_CONFIG,
+            # One log line per request is only worth formatting when debugging
+            access_log=logger.isEnabledFor(logging.DEBUG),
+            **loop_options
+        )
         
     except ImportError as e:
         print(f"Web server dependencies not available: {e}")
@@ -944,12 +1447,13 @@ def main():
     parser.add_argument("--web", action="store_true", help="Start web server")
     parser.add_argument("--host", default="0.0.0.0", help="Web server host")
     parser.add_argument("--port", type=int, default=8000, help="Web server port")
+    parser.add_argument("--workers", type=int, default=None, help="Web server worker processes (0 = one per CPU core)")
     parser.add_argument("--max-results", type=int, default=10, help="Maximum results per agent")
     
     args = parser.parse_args()
     
     if args.web:
-        run_web_server(args.host, args.port)
+        run_web_server(args.host, args.port, args.workers)
     elif args.query:
         asyncio.run(run_cli_query(args.query, args.max_results))
     else:
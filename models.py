@@ -1,8 +1,9 @@
+from dataclasses import dataclass
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-from enum import Enum
+from enum import StrEnum
 
-class AgentType(str, Enum):
+class AgentType(StrEnum):
     JIRA = "jira"
     GITHUB = "github"
     API = "api"
@@ -31,7 +32,10 @@ class WorkflowResponse(BaseModel):
     total_results: int
     execution_time: float
 
-class JiraIssue(BaseModel):
+# Interior records built by agents, never parsed from HTTP input: plain slotted
+# dataclasses skip validation and the per-instance __dict__
+@dataclass(slots=True, frozen=True)
+class JiraIssue:
     key: str
     summary: str
     description: Optional[str]
@@ -42,7 +46,8 @@ class JiraIssue(BaseModel):
     priority: Optional[str]
     issue_type: str
 
-class GitHubItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GitHubItem:
     type: str  # repository, issue, pull_request, commit
     name: str
     url: str
@@ -52,7 +57,8 @@ class GitHubItem(BaseModel):
     author: Optional[str]
     language: Optional[str]
 
-class FileSystemItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FileSystemItem:
     path: str
     name: str
     type: str  # file, directory
@@ -60,7 +66,8 @@ class FileSystemItem(BaseModel):
     modified: str
     content_preview: Optional[str]
 
-class VideoItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class VideoItem:
     title: str
     url: str
     duration: Optional[str]
@@ -69,7 +76,8 @@ class VideoItem(BaseModel):
     upload_date: Optional[str]
     view_count: Optional[int]
 
-class S3Object(BaseModel):
+@dataclass(slots=True, frozen=True)
+class S3Object:
     key: str
     size: int
     last_modified: str
@@ -77,7 +85,8 @@ class S3Object(BaseModel):
     etag: str
     content_type: Optional[str]
 
-class URLContent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class URLContent:
     url: str
     title: Optional[str]
     content: str
@@ -1,6 +1,9 @@
 import asyncio
+import aiohttp
+import hashlib
 import time
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from agents.jira_agent import JiraAgent
 from agents.github_agent import GitHubAgent
 from agents.api_agent import APIAgent
@@ -15,12 +18,55 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+class PromptCache:
+    """LRU cache of LLM answers keyed by a normalized prompt fingerprint"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def key(query: str, context: Tuple = ()) -> str:
+        """Fingerprint a query; case and whitespace differences map to the same key"""
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(f"{normalized}|{context!r}".encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Any:
+        """Return the cached answer, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: str, value: Any):
+        """Store an answer, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 class AgenticOrchestrator:
     """Main orchestrator that manages all agents and workflows"""
     
+    # Seconds an agent gets to answer a health probe
+    HEALTH_CHECK_TIMEOUT = 3.0
+    
+    # Repeat queries reuse LLM relevance decisions and summaries for this long
+    PROMPT_CACHE_MAXSIZE = 1024
+    PROMPT_CACHE_TTL = 600.0
+    
     def __init__(self):
         self.llm_client = get_llm_client()
         self.agents = {}
+        self._connector = None
+        self._relevance_cache = PromptCache(self.PROMPT_CACHE_MAXSIZE, self.PROMPT_CACHE_TTL)
+        self._summary_cache = PromptCache(self.PROMPT_CACHE_MAXSIZE, self.PROMPT_CACHE_TTL)
         self._initialize_agents()
     
     def _initialize_agents(self):
@@ -38,11 +84,54 @@ class AgenticOrchestrator:
         except Exception as e:
             logger.error(f"Failed to initialize agents: {str(e)}")
     
+    async def _share_connections(self):
+        """Give HTTP agents sessions over one pooled, keep-alive connector"""
+        if self._connector is not None and not self._connector.closed:
+            return
+        
+        # Sessions must be created inside the running loop, so this happens on first use
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30)
+        replaced = []
+        for agent in self.agents.values():
+            if hasattr(agent, 'session'):
+                replaced.append(agent.session)
+                agent.session = aiohttp.ClientSession(
+                    connector=connector,
+                    connector_owner=False,
+                    headers=getattr(agent, 'headers', None)
+                )
+        
+        # Publish only once every agent has its new session, so a concurrent request that
+        # returns early above never sees a session that is about to be closed
+        self._connector = connector
+        for session in replaced:
+            if session and not session.closed:
+                await session.close()
+    
+    async def warmup(self):
+        """Warm up the LLM client when LLM_WARMUP is enabled"""
+        if self.llm_client is not None and self.llm_client.warmup_on_start:
+            await self.llm_client.warmup()
+    
+    async def aclose(self):
+        """Close agent HTTP sessions and the shared connection pool"""
+        for agent in self.agents.values():
+            session = getattr(agent, 'session', None)
+            if session and not session.closed:
+                await session.close()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+        if self.llm_client is not None:
+            await self.llm_client.aclose()
+    
     async def process_query(self, request: QueryRequest) -> WorkflowResponse:
         """Process a natural language query using appropriate agents"""
         start_time = time.time()
         
         try:
+            await self._share_connections()
+            
             # Determine which agents are relevant for this query
             relevant_agents = await self._determine_relevant_agents(request.prompt, request.specific_sources)
             
@@ -57,31 +146,9 @@ class AgenticOrchestrator:
                 )
             
             # Execute searches with relevant agents in parallel
-            agent_tasks = []
-            for agent_type in relevant_agents:
-                agent = self.agents[agent_type]
-                task = asyncio.create_task(
-                    agent.search(request.prompt, request.max_results),
-                    name=f"{agent_type.value}_search"
-                )
-                agent_tasks.append((agent_type, task))
-            
-            # Wait for all agent searches to complete
-            results = []
-            for agent_type, task in agent_tasks:
-                try:
-                    result = await task
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Agent {agent_type.value} failed: {str(e)}")
-                    # Create error response for failed agent
-                    error_response = AgentResponse(
-                        agent_type=agent_type,
-                        success=False,
-                        data=[],
-                        error=str(e)
-                    )
-                    results.append(error_response)
+            results = await asyncio.gather(
+                *[self._search_agent(agent_type, request) for agent_type in relevant_agents]
+            )
             
             # Generate summary using AI if available
             summary = await self._generate_summary(request.prompt, results)
@@ -109,6 +176,36 @@ class AgenticOrchestrator:
                 execution_time=time.time() - start_time
             )
     
+    async def process_query_stream(self, request: QueryRequest) -> AsyncIterator[AgentResponse]:
+        """Yield each agent's response as soon as its search completes"""
+        await self._share_connections()
+        relevant_agents = await self._determine_relevant_agents(request.prompt, request.specific_sources)
+        
+        for next_result in asyncio.as_completed([self._search_agent(agent_type, request) for agent_type in relevant_agents]):
+            yield await next_result
+    
+    async def summarize(self, query: str, results: List[AgentResponse]) -> str:
+        """Summarize agent responses collected from process_query_stream"""
+        return await self._generate_summary(query, results)
+    
+    def summarize_stream(self, query: str, results: List[AgentResponse]) -> AsyncIterator[str]:
+        """Stream the summary of agent responses as text chunks"""
+        return self._generate_summary_stream(query, results)
+    
+    async def _search_agent(self, agent_type: AgentType, request: QueryRequest) -> AgentResponse:
+        """Run one agent's search, turning failures into an error response"""
+        try:
+            return await self.agents[agent_type].search(request.prompt, request.max_results)
+        except Exception as e:
+            logger.error(f"Agent {agent_type.value} failed: {str(e)}")
+            # Create error response for failed agent
+            return AgentResponse(
+                agent_type=agent_type,
+                success=False,
+                data=[],
+                error=str(e)
+            )
+    
     async def _determine_relevant_agents(self, query: str, specific_sources: Optional[List[AgentType]] = None) -> List[AgentType]:
         """Determine which agents are relevant for the given query"""
         if specific_sources:
@@ -117,16 +214,19 @@ class AgenticOrchestrator:
         
         relevant_agents = []
         
-        # Check each agent's relevance
-        for agent_type, agent in self.agents.items():
-            try:
-                if await agent.is_relevant(query):
-                    relevant_agents.append(agent_type)
-            except Exception as e:
-                logger.error(f"Failed to check relevance for {agent_type.value}: {str(e)}")
+        # Check every agent's relevance concurrently
+        checks = await asyncio.gather(
+            *[agent.is_relevant(query) for agent in self.agents.values()],
+            return_exceptions=True
+        )
+        for agent_type, is_relevant in zip(self.agents, checks):
+            if isinstance(is_relevant, Exception):
+                logger.error(f"Failed to check relevance for {agent_type.value}: {str(is_relevant)}")
+            elif is_relevant:
+                relevant_agents.append(agent_type)
         
         # If no agents are relevant, use AI to determine relevance (if available)
-        if not relevant_agents and self.openai_client:
+        if not relevant_agents and self.llm_client:
             relevant_agents = await self._ai_determine_relevance(query)
         
         # Fallback: if still no relevant agents, use all available agents
@@ -138,6 +238,11 @@ class AgenticOrchestrator:
     
     async def _ai_determine_relevance(self, query: str) -> List[AgentType]:
         """Use AI to determine which agents are relevant for the query"""
+        cache_key = PromptCache.key(query)
+        cached = self._relevance_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         try:
             prompt = f"""
             Given the following query, determine which data sources would be most relevant to search.
@@ -176,6 +281,7 @@ class AgenticOrchestrator:
                 except ValueError:
                     continue
             
+            self._relevance_cache.put(cache_key, tuple(suggested_agents))
             return suggested_agents
             
         except Exception as e:
@@ -187,23 +293,86 @@ class AgenticOrchestrator:
         if not self.llm_client:
             return self._generate_basic_summary(results)
         
+        cache_key = self._summary_key(query, results)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Prepare results summary for AI
-            results_summary = []
-            for result in results:
-                if result.success and result.data:
-                    results_summary.append({
-                        'agent': result.agent_type.value,
-                        'count': len(result.data),
-                        'sample_data': result.data[:2] if result.data else []  # First 2 items as sample
-                    })
-                elif not result.success:
-                    results_summary.append({
-                        'agent': result.agent_type.value,
-                        'error': result.error
-                    })
+            response = await self.llm_client.chat_completion(
+                messages=[{"role": "user", "content": self._summary_prompt(query, results)}],
+                max_tokens=250,
+                temperature=0.3
+            )
             
-            prompt = f"""
+            summary = response.strip()
+            self._summary_cache.put(cache_key, summary)
+            return summary
+            
+        except Exception as e:
+            logger.error(f"AI summary generation failed: {str(e)}")
+            return self._generate_basic_summary(results)
+    
+    async def _generate_summary_stream(self, query: str, results: List[AgentResponse]) -> AsyncIterator[str]:
+        """Yield the summary of the search results as the LLM produces it"""
+        if not self.llm_client:
+            yield self._generate_basic_summary(results)
+            return
+        
+        cache_key = self._summary_key(query, results)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        try:
+            async for chunk in self.llm_client.chat_completion_stream(
+                messages=[{"role": "user", "content": self._summary_prompt(query, results)}],
+                max_tokens=250,
+                temperature=0.3
+            ):
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+            
+        except Exception as e:
+            logger.error(f"AI summary generation failed: {str(e)}")
+            # The basic summary can only stand in if nothing has been sent yet
+            if not parts:
+                yield self._generate_basic_summary(results)
+            return
+        
+        self._summary_cache.put(cache_key, "".join(parts).strip())
+    
+    def _summary_key(self, query: str, results: List[AgentResponse]) -> str:
+        """Cache key for a summary of these results"""
+        # Covers the counts, sample data and errors the prompt is built from
+        return PromptCache.key(query, (repr(self._results_summary(results)),))
+    
+    def _results_summary(self, results: List[AgentResponse]) -> List[Dict[str, Any]]:
+        """Condense agent responses into what the summary prompt shows the LLM"""
+        results_summary = []
+        for result in results:
+            if result.success and result.data:
+                results_summary.append({
+                    'agent': result.agent_type.value,
+                    'count': len(result.data),
+                    'sample_data': result.data[:2] if result.data else []  # First 2 items as sample
+                })
+            elif not result.success:
+                results_summary.append({
+                    'agent': result.agent_type.value,
+                    'error': result.error
+                })
+        
+        return results_summary
+    
+    def _summary_prompt(self, query: str, results: List[AgentResponse]) -> str:
+        """Build the LLM prompt that summarizes the search results"""
+        results_summary = self._results_summary(results)
+        
+        return f"""
             Summarize the following search results for the query: "{query}"
             
             Results: {results_summary}
@@ -216,18 +385,6 @@ class AgenticOrchestrator:
             
             Keep the summary under 200 words.
             """
-            
-            response = await self.llm_client.chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=250,
-                temperature=0.3
-            )
-            
-            return response.strip()
-            
-        except Exception as e:
-            logger.error(f"AI summary generation failed: {str(e)}")
-            return self._generate_basic_summary(results)
     
     def _generate_basic_summary(self, results: List[AgentResponse]) -> str:
         """Generate a basic summary without AI"""
@@ -249,30 +406,45 @@ class AgenticOrchestrator:
     
     async def health_check(self) -> Dict[str, Any]:
         """Check the health of all agents"""
-        health_status = {}
+        await self._share_connections()
         
-        for agent_type, agent in self.agents.items():
-            try:
-                is_healthy = await agent.health_check()
-                health_status[agent_type.value] = {
-                    'healthy': is_healthy,
-                    'status': 'OK' if is_healthy else 'ERROR'
-                }
-            except Exception as e:
-                health_status[agent_type.value] = {
-                    'healthy': False,
-                    'status': 'ERROR',
-                    'error': str(e)
-                }
+        # Probe every agent concurrently so one slow agent doesn't add up with the rest
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                agent_type.value: tg.create_task(self._agent_health(agent))
+                for agent_type, agent in self.agents.items()
+            }
+        health_status = {name: task.result() for name, task in tasks.items()}
         
         overall_health = all(status['healthy'] for status in health_status.values())
         
         return {
             'overall_healthy': overall_health,
             'agents': health_status,
-            'openai_configured': self.openai_client is not None
+            'openai_configured': self.llm_client is not None
         }
     
+    async def _agent_health(self, agent) -> Dict[str, Any]:
+        """Check one agent's health, bounded by HEALTH_CHECK_TIMEOUT"""
+        try:
+            is_healthy = await asyncio.wait_for(agent.health_check(), timeout=self.HEALTH_CHECK_TIMEOUT)
+            return {
+                'healthy': is_healthy,
+                'status': 'OK' if is_healthy else 'ERROR'
+            }
+        except asyncio.TimeoutError:
+            return {
+                'healthy': False,
+                'status': 'ERROR',
+                'error': f"Health check timed out after {self.HEALTH_CHECK_TIMEOUT}s"
+            }
+        except Exception as e:
+            return {
+                'healthy': False,
+                'status': 'ERROR',
+                'error': str(e)
+            }
+    
     async def get_agent_capabilities(self) -> Dict[str, Any]:
         """Get information about agent capabilities"""
         capabilities = {}
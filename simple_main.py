@@ -7,7 +7,8 @@ import asyncio
 import json
 import os
 import sys
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 import logging
 
@@ -102,6 +103,40 @@ class SimpleOrchestrator:
             'execution_time': execution_time,
             'summary': f"Searched {len(relevant_agents)} agents and found {sum(len(r.get('results', [])) for r in results if r.get('success'))} results"
         }
+    
+    @cached_property
+    def llm_client(self):
+        """Configured LLM client, or None when its dependencies or credentials are missing"""
+        try:
+            from llm_client import get_llm_client
+            return get_llm_client()
+        except Exception as e:
+            logger.info(f"LLM summaries unavailable, using basic summary: {e}")
+            return None
+    
+    async def summarize_stream(self, response: Dict[str, Any]) -> AsyncIterator[str]:
+        """Yield a summary of a process_query response as the LLM produces it"""
+        if self.llm_client is None:
+            yield response['summary']
+            return
+        
+        outcomes = ', '.join(
+            f"{r['agent']}: {len(r.get('results', []))} results" if r.get('success') else f"{r['agent']}: error"
+            for r in response['results']
+        )
+        prompt = f"Summarize these search results for query '{response['query']}' in under 100 words: {outcomes}"
+        
+        sent = False
+        try:
+            async for chunk in self.llm_client.chat_completion_stream([{"role": "user", "content": prompt}], max_tokens=150):
+                if chunk:
+                    sent = True
+                    yield chunk
+        except Exception as e:
+            logger.error(f"LLM summary failed: {e}")
+            # The basic summary can only stand in if nothing has been sent yet
+            if not sent:
+                yield response['summary']
 
 async def main():
     """Main function for CLI usage"""
@@ -170,8 +205,8 @@ async def main():
 def create_web_server():
     """Create a simple web server"""
     try:
-        from fastapi import FastAPI
-        from fastapi.responses import HTMLResponse
+        from fastapi import FastAPI, Request
+        from fastapi.responses import HTMLResponse, StreamingResponse
         import uvicorn
         
         app = FastAPI(title="Simple Agentic AI Workflows")
@@ -179,7 +214,7 @@ def create_web_server():
         
         @app.get("/", response_class=HTMLResponse)
         async def root():
-            return """
+            return r"""
             <!DOCTYPE html>
             <html>
             <head>
@@ -213,41 +248,79 @@ def create_web_server():
                         try {
                             const response = await fetch('/search', {
                                 method: 'POST',
-                                headers: {'Content-Type': 'application/json'},
+                                headers: {'Content-Type': 'application/json', 'Accept': 'text/event-stream'},
                                 body: JSON.stringify({query: query})
                             });
                             
-                            const data = await response.json();
-                            
-                            let html = `<h3>Results for: "${data.query}"</h3>`;
-                            html += `<p>Agents: ${data.agents_used.join(', ')}</p>`;
-                            html += `<p>Total Results: ${data.total_results}</p>`;
-                            
-                            data.results.forEach(result => {
-                                html += `<h4>${result.agent} Agent</h4>`;
-                                if (result.success) {
-                                    result.results.forEach(item => {
-                                        html += `<p>• ${item}</p>`;
-                                    });
-                                } else {
-                                    html += `<p style="color: red;">Error: ${result.error}</p>`;
+                            // Results arrive in one frame; summary text follows chunk by chunk
+                            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                            let buffer = '';
+                            let summary = null;
+                            while (true) {
+                                const {value, done} = await reader.read();
+                                if (done) break;
+                                buffer += value;
+                                const frames = buffer.split('\n\n');
+                                buffer = frames.pop();
+                                for (const frame of frames) {
+                                    if (!frame.startsWith('data: ')) continue;
+                                    const event = JSON.parse(frame.slice(6));
+                                    if (event.type === 'result') {
+                                        resultsDiv.innerHTML = renderResults(event.data);
+                                        summary = document.getElementById('summary');
+                                    } else if (event.type === 'summary' && summary) {
+                                        summary.textContent += event.data;
+                                    }
                                 }
-                            });
-                            
-                            resultsDiv.innerHTML = html;
+                            }
                         } catch (error) {
                             resultsDiv.innerHTML = `<p style="color: red;">Error: ${error.message}</p>`;
                         }
                     }
+                    
+                    function renderResults(data) {
+                        let html = `<h3>Results for: "${data.query}"</h3>`;
+                        html += `<p>Agents: ${data.agents_used.join(', ')}</p>`;
+                        html += `<p>Total Results: ${data.total_results}</p>`;
+                        html += `<p><strong>Summary:</strong> <span id="summary"></span></p>`;
+                        
+                        data.results.forEach(result => {
+                            html += `<h4>${result.agent} Agent</h4>`;
+                            if (result.success) {
+                                result.results.forEach(item => {
+                                    html += `<p>• ${item}</p>`;
+                                });
+                            } else {
+                                html += `<p style="color: red;">Error: ${result.error}</p>`;
+                            }
+                        });
+                        
+                        return html;
+                    }
                 </script>
             </body>
             </html>
             """
         
+        def sse(kind: str, data: Any) -> str:
+            """Encode one server-sent event frame"""
+            return f"data: {json.dumps({'type': kind, 'data': data})}\n\n"
+        
         @app.post("/search")
-        async def search(request: dict):
+        async def search(request: dict, http_request: Request):
             query = request.get('query', '')
-            return await orchestrator.process_query(query)
+            response = await orchestrator.process_query(query)
+            
+            # Plain JSON unless the client asks for the streamed summary
+            if 'text/event-stream' not in http_request.headers.get('accept', ''):
+                return response
+            
+            async def events():
+                yield sse('result', response)
+                async for chunk in orchestrator.summarize_stream(response):
+                    yield sse('summary', chunk)
+            
+            return StreamingResponse(events(), media_type="text/event-stream")
         
         print("🚀 Starting Simple Agentic AI Workflows Web Server...")
         print("Server will be available at: http://localhost:8000")
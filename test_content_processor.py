@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Regression tests for content chunking
+"""
+
+import json
+import os
+import pickle
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from content_processor import ContentProcessor
+
+SAMPLE = "Hello world. This is a test! Another sentence? And more text here.\n\nNew para " * 5
+
+def _spans(processor, text):
+    """Return the (chunk_start, chunk_end) pairs recorded on each chunk"""
+    return [(c.metadata['chunk_start'], c.metadata['chunk_end']) for c in processor.chunk_text(text, 'src', 'file')]
+
+def test_chunk_spans_prefer_periods():
+    """A period in the window wins over later '!', '?' or blank lines"""
+    assert _spans(ContentProcessor(50, 10), SAMPLE) == [(0, 143), (143, 243), (243, 374), (374, 424)]
+
+def test_chunk_spans_without_periods():
+    """Lower-priority terminators are used when no period is in range"""
+    text = "No period here! Or here? " * 20
+    assert _spans(ContentProcessor(120, 30), text) == [(0, 215), (215, 415), (415, 535)]
+
+def test_chunk_spans_ascii_and_unicode_agree():
+    """Non-ASCII text takes the str path and lands on the same boundaries"""
+    ascii_spans = _spans(ContentProcessor(50, 10), SAMPLE)
+    assert _spans(ContentProcessor(50, 10), SAMPLE.replace("Hello", "Héllo")) == ascii_spans
+
+def test_short_text_is_one_chunk():
+    """Text shorter than chunk_size is returned whole"""
+    chunks = ContentProcessor(50, 10).chunk_text("short", 'src', 'file', {'k': 'v'})
+    assert len(chunks) == 1
+    assert chunks[0].metadata == {'k': 'v'}
+
+def test_chunks_pickle_and_serialize():
+    """Chunk metadata views survive pickling and JSON via to_dict()"""
+    chunk = ContentProcessor(50, 10).chunk_text(SAMPLE, 'src', 'file', {'title': 'Sample'})[1]
+    
+    restored = pickle.loads(pickle.dumps(chunk))
+    assert restored.metadata == {'title': 'Sample', 'chunk_start': 143, 'chunk_end': 243, 'chunk_index': 1}
+    assert (restored.chunk_id, restored.content, restored.created_at_ns) == (chunk.chunk_id, chunk.content, chunk.created_at_ns)
+    
+    assert json.loads(json.dumps(chunk.to_dict()))['metadata'] == restored.metadata
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Regression tests for LLMClient lifecycle helpers
+"""
+
+import asyncio
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import llm_client
+from llm_client import LLMClient
+
+def _ollama_client(reply="pong"):
+    """An Ollama-backed client with no server probe and a canned provider reply"""
+    client = LLMClient("ollama", verify=False, warmup=True)
+    calls = []
+    
+    async def complete(messages, **kwargs):
+        calls.append(messages)
+        return reply
+    
+    client._chat_dispatch["ollama"] = complete
+    return client, calls
+
+def test_warmup_is_explicit_and_uncached():
+    """warmup() hits the provider once and leaves the response cache empty"""
+    client, calls = _ollama_client()
+    assert client.warmup_on_start
+    assert calls == []
+    
+    asyncio.run(client.warmup())
+    assert len(calls) == 1
+    assert len(client._cache) == 0
+
+def test_aclose_releases_session_and_worker():
+    """aclose() closes the Ollama session and stops the batch worker; the client stays usable"""
+    client, calls = _ollama_client()
+    
+    async def run():
+        session = await client._get_ollama_session()
+        assert await client.chat_completion([{"role": "user", "content": "hi"}]) == "pong"
+        worker = client._batch_worker
+        
+        await client.aclose()
+        await asyncio.sleep(0)
+        assert session.closed
+        assert worker.cancelled()
+        
+        # A later call starts a fresh worker
+        assert await client.chat_completion([{"role": "user", "content": "again"}]) == "pong"
+        await client.aclose()
+    
+    asyncio.run(run())
+    assert len(calls) == 2
+
+def test_stopping_worker_fails_queued_requests():
+    """Requests left in the queue when the worker is stopped get an error instead of hanging"""
+    client, calls = _ollama_client()
+    
+    async def run():
+        client._ensure_batch_worker()
+        client._batch_worker.cancel()
+        await asyncio.sleep(0)
+        
+        future = asyncio.get_running_loop().create_future()
+        client._batch_queue.put_nowait(([{"role": "user", "content": "hi"}], {}, future))
+        
+        # The dead worker is replaced on the next call; its queue is drained
+        client._ensure_batch_worker()
+        try:
+            await future
+        except RuntimeError as e:
+            assert "stopped" in str(e)
+        else:
+            raise AssertionError("queued request was not failed")
+        await client.aclose()
+    
+    asyncio.run(run())
+    assert calls == []
+
+def test_aclose_replaces_shared_http_client():
+    """aclose() closes the shared httpx pool and rebinds the client to a fresh one"""
+    client, _ = _ollama_client()
+    
+    def initialize():
+        # Stand-in for the openai/groq initializers, which take the shared pool
+        client._http_client = llm_client._get_http2_client()
+    
+    client._init_dispatch["ollama"] = initialize
+    client._initialize_client()
+    shared = client._http_client
+    
+    asyncio.run(client.aclose())
+    assert shared.is_closed
+    assert client._http_client is not shared
+    assert client._http_client is llm_client._http2_client
+    assert not client._http_client.is_closed
+    
+    asyncio.run(client.aclose())
+    assert llm_client._http2_client is not None
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
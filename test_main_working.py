@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the main_working filesystem scan
+"""
+
+import os
+import re
+import sys
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main_working import MAX_SCAN_BYTES, _match_file
+
+def _entry(path):
+    """Return the DirEntry for a single file"""
+    directory, name = os.path.split(str(path))
+    with os.scandir(directory) as it:
+        return next(entry for entry in it if entry.name == name)
+
+def _match(path, query):
+    """Run _match_file the way WorkingFileSystemAgent._scan prepares the query"""
+    query_re = re.compile(re.escape(query.encode()), re.IGNORECASE) if query.isascii() else None
+    return _match_file(_entry(path), query.lower(), query_re, query.casefold())
+
+def test_match_file_ascii_ignores_case(tmp_path):
+    """ASCII queries match content regardless of case"""
+    path = tmp_path / "notes.txt"
+    path.write_text("some text\nHello World\n")
+    
+    result = _match(path, "hello world")
+    assert result['match_type'] == 'content'
+    assert 'Hello World' in result['preview']
+
+def test_match_file_non_ascii_ignores_case(tmp_path):
+    """Non-ASCII queries fold case like the original lower() comparison"""
+    path = tmp_path / "notes.txt"
+    path.write_text("Straße und über alles\n", encoding='utf-8')
+    
+    assert _match(path, "Über")['match_type'] == 'content'
+    assert _match(path, "STRASSE UND") is None  # ASCII query, like the original lower() check
+    assert _match(path, "ÜBER ALLES")['match_type'] == 'content'
+    assert _match(path, "äpfel") is None
+
+def test_match_file_filename_hit_skips_content(tmp_path):
+    """A filename match is reported without reading the file"""
+    path = tmp_path / "Config.txt"
+    path.write_text("nothing relevant")
+    
+    result = _match(path, "config")
+    assert result['match_type'] == 'filename'
+    assert result['preview'] == ''
+
+def test_match_file_only_scans_head(tmp_path):
+    """Content past MAX_SCAN_BYTES is not searched"""
+    path = tmp_path / "big.txt"
+    with open(path, 'wb') as f:
+        f.write(b"x" * MAX_SCAN_BYTES)
+        f.write(b"needle")
+    
+    assert _match(path, "needle") is None
+
+def _search_client(monkeypatch):
+    """Return a TestClient whose orchestrator records the prompts it is asked to run"""
+    from fastapi.testclient import TestClient
+    from main_working import create_app, get_orchestrator
+    from models import AgentType, WorkflowResponse
+    
+    calls = []
+    
+    async def process_query(request):
+        calls.append(request.prompt)
+        return WorkflowResponse(query=request.prompt, agents_used=[AgentType.FILESYSTEM], results=[], summary="", total_results=0, execution_time=0.0)
+    
+    app = create_app()
+    monkeypatch.setattr(get_orchestrator(), 'process_query', process_query)
+    return TestClient(app), calls
+
+def test_search_cache_reuses_identical_prompt(monkeypatch):
+    """A repeated prompt is answered from the cache"""
+    client, calls = _search_client(monkeypatch)
+    
+    for _ in range(2):
+        assert client.post("/search", json={"prompt": "find config files"}).status_code == 200
+    assert calls == ["find config files"]
+
+def test_search_cache_keeps_url_case(monkeypatch):
+    """URL prompts differing only in path case are separate queries"""
+    client, calls = _search_client(monkeypatch)
+    
+    first = client.post("/search", json={"prompt": "https://example.com/Foo"}).json()
+    second = client.post("/search", json={"prompt": "https://example.com/foo"}).json()
+    assert calls == ["https://example.com/Foo", "https://example.com/foo"]
+    assert (first['query'], second['query']) == ("https://example.com/Foo", "https://example.com/foo")
+
+def _preview_client(monkeypatch, root):
+    """Return a TestClient whose /preview is confined to root"""
+    from fastapi.testclient import TestClient
+    from main_working import _allowed_roots, create_app
+    
+    # The allowed roots are computed once from the working directory
+    monkeypatch.chdir(root)
+    _allowed_roots.cache_clear()
+    return TestClient(create_app())
+
+def test_preview_serves_files_under_root(monkeypatch, tmp_path):
+    """A file inside the allowed root is previewed"""
+    (tmp_path / "notes.txt").write_text("hello preview")
+    client = _preview_client(monkeypatch, tmp_path)
+    
+    response = client.post("/preview", json={"path": "notes.txt"})
+    assert response.status_code == 200
+    assert response.json()['content'] == "hello preview"
+
+def test_preview_rejects_symlink_escape(monkeypatch, tmp_path):
+    """Symlinks and '..' leading outside the root report 404, even after a previous allowed hit"""
+    root, outside = tmp_path / "root", tmp_path / "outside"
+    root.mkdir()
+    outside.mkdir()
+    (root / "inside.txt").write_text("inside")
+    (outside / "secret.txt").write_text("secret")
+    link = root / "link.txt"
+    link.symlink_to(root / "inside.txt")
+    client = _preview_client(monkeypatch, root)
+    
+    assert client.post("/preview", json={"path": "link.txt"}).status_code == 200
+    
+    # Retarget the same path outside the root; the check must see the new target
+    link.unlink()
+    link.symlink_to(outside / "secret.txt")
+    assert client.post("/preview", json={"path": "link.txt"}).status_code == 404
+    assert client.post("/preview", json={"path": "../outside/secret.txt"}).status_code == 404
+
+def test_accepts_encoding_honours_q_values():
+    """Codings refused with q=0 are not served; '*' covers unlisted codings"""
+    from main_working import _accepts_encoding
+    
+    assert _accepts_encoding("gzip, deflate, br", "br")
+    assert not _accepts_encoding("br;q=0, gzip", "br")
+    assert not _accepts_encoding("gzip;q=0.0", "gzip")
+    assert _accepts_encoding("GZIP ; Q=0.5", "gzip")
+    assert _accepts_encoding("*", "gzip")
+    assert not _accepts_encoding("*, gzip;q=0", "gzip")
+    assert not _accepts_encoding("*;q=0", "br")
+    assert not _accepts_encoding("", "gzip")
+    assert not _accepts_encoding("xgzip", "gzip")
+
+def test_home_varies_on_accept_encoding():
+    """Every home page variant, including identity, carries Vary: Accept-Encoding"""
+    from fastapi.testclient import TestClient
+    from main_working import create_app
+    
+    client = TestClient(create_app())
+    
+    identity = client.get("/", headers={"Accept-Encoding": "gzip;q=0, br;q=0"})
+    assert identity.status_code == 200
+    assert 'content-encoding' not in identity.headers
+    assert identity.headers['vary'] == "Accept-Encoding"
+    
+    compressed = client.get("/", headers={"Accept-Encoding": "br;q=0, gzip"})
+    assert compressed.headers['content-encoding'] == "gzip"
+    assert compressed.headers['vary'] == "Accept-Encoding"
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Regression tests for orchestrator summaries
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import orchestrator
+from models import AgentResponse, AgentType
+
+class FakeLLM:
+    """LLM client stand-in that records which API was called"""
+    
+    def __init__(self, chunks, fail=False):
+        self.chunks = chunks
+        self.fail = fail
+        self.calls = []
+    
+    async def chat_completion(self, messages, **kwargs):
+        self.calls.append('chat_completion')
+        if self.fail:
+            raise RuntimeError("provider down")
+        return "".join(self.chunks)
+    
+    async def chat_completion_stream(self, messages, **kwargs):
+        self.calls.append('chat_completion_stream')
+        for chunk in self.chunks:
+            yield chunk
+        if self.fail:
+            raise RuntimeError("stream dropped")
+    
+    async def aclose(self):
+        pass
+
+def _orchestrator(monkeypatch, llm):
+    """Build an orchestrator wired to the given LLM client"""
+    monkeypatch.setattr(orchestrator, 'get_llm_client', lambda: llm)
+    return orchestrator.AgenticOrchestrator()
+
+def _results(*files):
+    """One successful filesystem response holding the given file names"""
+    return [AgentResponse(agent_type=AgentType.FILESYSTEM, success=True, data=[{'file_name': f} for f in files])]
+
+def test_summary_uses_chat_completion(monkeypatch):
+    """The non-streaming summary goes through chat_completion"""
+    llm = FakeLLM([" Found ", "two files. "])
+    orc = _orchestrator(monkeypatch, llm)
+    
+    assert asyncio.run(orc.summarize("q", _results("a.py", "b.py"))) == "Found two files."
+    assert llm.calls == ['chat_completion']
+
+def test_summary_falls_back_on_failure(monkeypatch):
+    """A failed completion falls back to the basic summary"""
+    results = _results("a.py")
+    orc = _orchestrator(monkeypatch, FakeLLM(["partial"], fail=True))
+    
+    assert asyncio.run(orc.summarize("q", results)) == orc._generate_basic_summary(results)
+
+def test_summary_stream_yields_chunks(monkeypatch):
+    """summarize_stream passes provider chunks through as they arrive"""
+    llm = FakeLLM(["Found ", "two ", "files."])
+    orc = _orchestrator(monkeypatch, llm)
+    
+    async def collect():
+        return [chunk async for chunk in orc.summarize_stream("q", _results("a.py", "b.py"))]
+    
+    assert asyncio.run(collect()) == ["Found ", "two ", "files."]
+    assert llm.calls == ['chat_completion_stream']
+
+def test_summary_cache_reuses_identical_results(monkeypatch):
+    """The same query over the same results is summarized once"""
+    llm = FakeLLM(["summary"])
+    orc = _orchestrator(monkeypatch, llm)
+    
+    for _ in range(2):
+        asyncio.run(orc.summarize("q", _results("a.py", "b.py")))
+    assert llm.calls == ['chat_completion']
+
+def test_summary_cache_sees_sample_data(monkeypatch):
+    """Results with equal counts but different contents get their own summary"""
+    llm = FakeLLM(["summary"])
+    orc = _orchestrator(monkeypatch, llm)
+    
+    asyncio.run(orc.summarize("q", _results("a.py", "b.py")))
+    asyncio.run(orc.summarize("q", _results("c.py", "d.py")))
+    assert llm.calls == ['chat_completion', 'chat_completion']
+
+def test_summary_cache_sees_error_text(monkeypatch):
+    """Different agent errors are not answered with one cached summary"""
+    llm = FakeLLM(["summary"])
+    orc = _orchestrator(monkeypatch, llm)
+    
+    for error in ("timeout", "401 unauthorized"):
+        failed = [AgentResponse(agent_type=AgentType.JIRA, success=False, data=[], error=error)]
+        asyncio.run(orc.summarize("q", failed))
+    assert llm.calls == ['chat_completion', 'chat_completion']
+
+def test_prompt_cache_normalizes_and_expires(monkeypatch):
+    """Keys ignore case and spacing; entries expire after the TTL and evict LRU-first"""
+    now = [0.0]
+    monkeypatch.setattr(orchestrator.time, 'monotonic', lambda: now[0])
+    cache = orchestrator.PromptCache(maxsize=2, ttl=10.0)
+    
+    cache.put(orchestrator.PromptCache.key("Find  Files"), "a")
+    assert cache.get(orchestrator.PromptCache.key("find files")) == "a"
+    
+    cache.put("b", "b")
+    cache.put("c", "c")
+    assert cache.get(orchestrator.PromptCache.key("find files")) is None
+    
+    now[0] = 11.0
+    assert cache.get("c") is None
+
+def test_concurrent_first_requests_share_open_sessions(monkeypatch):
+    """A request racing the first connection setup never sees a closed session"""
+    orc = _orchestrator(monkeypatch, FakeLLM([]))
+    
+    async def run():
+        import aiohttp
+        agent = SimpleNamespace(session=aiohttp.ClientSession())
+        orc.agents = {AgentType.GITHUB: agent}
+        
+        async def first_use():
+            await orc._share_connections()
+            return agent.session
+        
+        sessions = await asyncio.gather(first_use(), first_use())
+        assert all(not session.closed for session in sessions)
+        await orc.aclose()
+    
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))